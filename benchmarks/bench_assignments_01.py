@@ -0,0 +1,48 @@
+"""assignments_01: 리스트(map) 경로 vs 배열(NumPy) 경로 비교.
+
+실행:
+    uv run python benchmarks/bench_assignments_01.py [max_exp]
+
+max_exp(기본 8)까지 10**3 ... 10**max_exp 원소에서 측정한다.
+"""
+from __future__ import annotations
+
+import sys
+import time
+
+import numpy as np
+
+from fp_learning import assignments_01 as A_01
+
+
+def _best_of(fn, arg, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn(arg)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main(max_exp: int = 8) -> None:
+    print(f"{'n':>12} {'fn':>12} {'list(s)':>10} {'array(s)':>10} {'speedup':>8}")
+    for exp in range(3, max_exp + 1):
+        n = 10**exp
+        repeat = 5 if exp <= 6 else 1
+        ints = np.arange(n, dtype=np.int64) % 1000
+        ints_list = ints.tolist()
+        # 문자열 배열은 메모리 때문에 10**6 에서 자른다.
+        words = np.array(["x" * (i % 16) for i in range(min(n, 10**6))])
+        cases = [
+            ("assignment1", A_01.assignment1, A_01.assignment1_array, ints, ints_list),
+            ("assignment3", A_01.assignment3, A_01.assignment3_array, ints, ints_list),
+            ("assignment2", A_01.assignment2, A_01.assignment2_array, words, words.tolist()),
+        ]
+        for name, list_fn, array_fn, arr, plain in cases:
+            t_list = _best_of(list_fn, plain, repeat)
+            t_array = _best_of(array_fn, arr, repeat)
+            print(f"{len(plain):>12} {name:>12} {t_list:>10.4f} {t_array:>10.4f} {t_list / t_array:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 8)
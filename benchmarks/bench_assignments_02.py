@@ -0,0 +1,42 @@
+"""assignments_02: 순수 파이썬 batched/take/drop vs itertools 기반 *_fast.
+
+실행:
+    uv run python benchmarks/bench_assignments_02.py [n]
+
+기본 n = 10_000_000 원소 스트림.
+"""
+from __future__ import annotations
+
+import itertools
+import sys
+import time
+from collections import deque
+
+from fp_learning import assignments_02 as A_02
+
+
+def _consume(it) -> None:
+    deque(it, maxlen=0)
+
+
+def _time(fn) -> float:
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+
+def main(n: int = 10_000_000) -> None:
+    cases = [
+        ("batched k=64", lambda: A_02.batched(iter(range(n)), 64), lambda: A_02.batched_fast(iter(range(n)), 64)),
+        ("take n", lambda: A_02.take(n, itertools.count()), lambda: A_02.take_fast(n, itertools.count())),
+        ("drop n/2", lambda: A_02.drop(n // 2, iter(range(n))), lambda: A_02.drop_fast(n // 2, iter(range(n)))),
+    ]
+    print(f"{'case':>14} {'python(s)':>10} {'fast(s)':>10} {'speedup':>8}")
+    for name, slow, fast in cases:
+        t_slow = _time(lambda: _consume(slow()))
+        t_fast = _time(lambda: _consume(fast()))
+        print(f"{name:>14} {t_slow:>10.3f} {t_fast:>10.3f} {t_slow / t_fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000)
@@ -0,0 +1,77 @@
+"""batched vs batched_timed / abatched_timed: 수신 -> flush 지연(p50/p99).
+
+느린 라이브 피드(지수분포 도착 간격)를 흉내 내고, 각 원소가 소스에서 나온 시각부터
+그 원소가 속한 배치가 소비자에게 전달된 시각까지를 잰다.
+
+실행:
+    uv run python benchmarks/bench_batched_timed.py [n_items] [rate_per_s]
+"""
+from __future__ import annotations
+
+import asyncio
+import random
+import sys
+import time
+
+from fp_learning.aio import abatched_timed
+from fp_learning.assignments_02 import batched, batched_timed
+
+K = 64
+MAX_WAIT = 0.02
+
+
+def _feed(n: int, rate: float, stamps: dict[int, float], seed: int = 0):
+    rnd = random.Random(seed)
+    for i in range(n):
+        time.sleep(rnd.expovariate(rate))
+        stamps[i] = time.monotonic()
+        yield i
+
+
+async def _afeed(n: int, rate: float, stamps: dict[int, float], seed: int = 0):
+    rnd = random.Random(seed)
+    for i in range(n):
+        await asyncio.sleep(rnd.expovariate(rate))
+        stamps[i] = time.monotonic()
+        yield i
+
+
+def _pct(xs: list[float], p: float) -> float:
+    xs = sorted(xs)
+    return xs[min(len(xs) - 1, int(p * len(xs)))]
+
+
+def _report(name: str, lat: list[float]) -> None:
+    print(f"{name:>16} {_pct(lat, 0.5) * 1e3:>9.2f} {_pct(lat, 0.99) * 1e3:>9.2f} {max(lat) * 1e3:>9.2f}")
+
+
+def _measure_sync(batches, stamps) -> list[float]:
+    lat = []
+    for b in batches:
+        now = time.monotonic()
+        lat.extend(now - stamps[i] for i in b)
+    return lat
+
+
+async def _measure_async(n: int, rate: float) -> list[float]:
+    stamps: dict[int, float] = {}
+    lat = []
+    async for b in abatched_timed(_afeed(n, rate, stamps), K, MAX_WAIT):
+        now = time.monotonic()
+        lat.extend(now - stamps[i] for i in b)
+    return lat
+
+
+def main(n: int = 2000, rate: float = 500.0) -> None:
+    print(f"k={K} max_wait={MAX_WAIT * 1e3:.0f}ms n={n} rate={rate:.0f}/s")
+    print(f"{'mode':>16} {'p50(ms)':>9} {'p99(ms)':>9} {'max(ms)':>9}")
+    stamps: dict[int, float] = {}
+    _report("batched", _measure_sync(batched(_feed(n, rate, stamps), K), stamps))
+    stamps = {}
+    _report("batched_timed", _measure_sync(batched_timed(_feed(n, rate, stamps), K, MAX_WAIT), stamps))
+    _report("abatched_timed", asyncio.run(_measure_async(n, rate)))
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    main(int(args[0]) if args else 2000, float(args[1]) if len(args) > 1 else 500.0)
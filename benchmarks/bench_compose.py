@@ -0,0 +1,28 @@
+"""assignments_04: 중첩 compose2 vs compose(*fs) — 체인 길이별 호출당 시간(ns).
+
+실행:
+    uv run python benchmarks/bench_compose.py
+"""
+from __future__ import annotations
+
+import timeit
+from functools import reduce
+
+from fp_learning.assignments_04 import compose, compose2
+
+
+def main() -> None:
+    inc = lambda x: x + 1
+    print(f"{'stages':>6} {'compose2 ns':>12} {'compose ns':>11} {'speedup':>8}")
+    for n in (1, 2, 5, 10, 20, 50, 100):
+        fs = [inc] * n
+        nested = reduce(compose2, fs)
+        flat = compose(*fs)
+        number = 200_000 // n
+        t_nested = min(timeit.repeat(lambda: nested(0), number=number, repeat=5)) / number * 1e9
+        t_flat = min(timeit.repeat(lambda: flat(0), number=number, repeat=5)) / number * 1e9
+        print(f"{n:>6} {t_nested:>12.0f} {t_flat:>11.0f} {t_nested / t_flat:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""assignments_04: discounted_total_for_books vs discounted_total_engine (행 / 병렬 / 컬럼형).
+
+실행:
+    uv run python benchmarks/bench_discounted_total.py [n]
+"""
+from __future__ import annotations
+
+import random
+import sys
+import time
+
+from fp_learning.assignments_04 import discounted_total_engine, discounted_total_for_books
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+def _orders(n: int) -> list[dict]:
+    rnd = random.Random(0)
+    cats = ("book", "toy", "food")
+    return [
+        {"name": "x", "price": round(rnd.uniform(0.5, 500.0), 2), "qty": rnd.randint(0, 5), "category": rnd.choice(cats)}
+        for _ in range(n)
+    ]
+
+
+def _time(label: str, fn) -> None:
+    t0 = time.perf_counter()
+    value = fn()
+    print(f"{label:<28} {time.perf_counter() - t0:8.3f}s  -> {value}")
+
+
+def main(n: int) -> None:
+    rows = _orders(n)
+    _time("original", lambda: discounted_total_for_books(rows))
+    _time("engine (fsum)", lambda: discounted_total_engine(rows))
+    _time("engine (float)", lambda: discounted_total_engine(rows, exact=False))
+    _time("engine (workers=4)", lambda: discounted_total_engine(rows, workers=4))
+    cols = {f: [r[f] for r in rows] for f in ("price", "qty", "category")}
+    _time("engine (dict-of-lists)", lambda: discounted_total_engine(cols))
+    if np is not None:
+        arr = np.array(
+            [(r["price"], r["qty"], r["category"]) for r in rows],
+            dtype=[("price", "f8"), ("qty", "i8"), ("category", "U8")],
+        )
+        _time("engine (structured array)", lambda: discounted_total_engine(arr))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,60 @@
+"""assignments_03: process_numbers_pipeline 의 할당량(tracemalloc)과 처리량(timeit),
+그리고 process_numbers_batch(리스트 / NumPy 문자열 배열) 처리량 비교.
+
+실행:
+    uv run python benchmarks/bench_maybe.py [n]
+
+n(기본 10_000_000)개 문자열로 처리량을 재고, tracemalloc 은 느리므로 min(n, 1_000_000)개로 잰다.
+"""
+from __future__ import annotations
+
+import sys
+import timeit
+import tracemalloc
+
+from fp_learning.assignments_03 import Just, Nothing, process_numbers_batch, process_numbers_pipeline
+
+
+def _inputs(n: int) -> list[str]:
+    pool = ["10", "-", "20", "x", "7", "50", "3", "-2", "oops", "0", "12", "1000"]
+    return [pool[i % len(pool)] for i in range(n)]
+
+
+def _allocations(strings: list[str]) -> tuple[int, int]:
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    before = tracemalloc.take_snapshot()
+    out = process_numbers_pipeline(strings)
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    blocks = sum(s.count_diff for s in after.compare_to(before, "filename"))
+    del out
+    return peak, blocks
+
+
+def _wrapper_bytes(obj: object) -> int:
+    d = getattr(obj, "__dict__", None)
+    return sys.getsizeof(obj) + (sys.getsizeof(d) if d is not None else 0)
+
+
+def main(n: int = 10_000_000) -> None:
+    print(f"sizes: Just={_wrapper_bytes(Just(1))} B  Nothing singleton={Nothing() is Nothing()}")
+    strings = _inputs(n)
+    cases = [("pipeline", process_numbers_pipeline, strings), ("batch(list)", process_numbers_batch, strings)]
+    try:
+        import numpy as np
+        cases.append(("batch(ndarray)", process_numbers_batch, np.array(strings)))
+    except ImportError:
+        pass
+    for name, fn, data in cases:
+        secs = min(timeit.repeat(lambda: fn(data), number=1, repeat=3))
+        print(f"{name:>15}: n={n} {secs:.3f}s  {n / secs / 1e6:.2f} M strings/s  {secs / n * 1e9:.0f} ns/string")
+
+    m = min(n, 1_000_000)
+    peak, blocks = _allocations(strings[:m])
+    print(f"tracemalloc: n={m} peak={peak / m:.1f} B/string  live blocks after={blocks}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000)
@@ -0,0 +1,52 @@
+"""mmapio: 큰 로그 파일에서 앞 n줄 건너뛰기 — 파일 반복 + drop vs MappedLines.drop / MappedRecords.drop.
+
+실행:
+    uv run python benchmarks/bench_mmap_drop.py [줄 수]
+"""
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import time
+
+from fp_learning.assignments_02 import drop
+from fp_learning.mmapio import MappedLines, MappedRecords
+
+
+def _time(label: str, fn) -> None:
+    t0 = time.perf_counter()
+    value = fn()
+    print(f"{label:<34} {time.perf_counter() - t0:8.4f}s  -> {value!r}")
+
+
+def main(n: int) -> None:
+    with tempfile.TemporaryDirectory() as d:
+        log = os.path.join(d, "app.log")
+        with open(log, "wb") as f:
+            f.writelines(b"2024-01-01T00:00:00 INFO request id=%d\n" % i for i in range(n))
+        recs = os.path.join(d, "recs.bin")
+        with open(recs, "wb") as f:
+            f.writelines(i.to_bytes(8, "little") for i in range(n))
+        skip = n - 3
+        print(f"lines={n:,}  size={os.path.getsize(log) / 2**20:.1f} MiB  skip={skip:,}")
+
+        def plain() -> bytes:
+            with open(log, "rb") as f:
+                return next(drop(skip, f)).rstrip(b"\n")
+
+        def mapped() -> bytes:
+            with MappedLines(log) as src:
+                return bytes(next(src.drop(skip)))
+
+        def records() -> int:
+            with MappedRecords(recs, 8) as src:
+                return int.from_bytes(next(src.drop(skip)), "little")
+
+        _time("open() + drop", plain)
+        _time("MappedLines.drop (cold)", mapped)
+        _time("MappedRecords.drop", records)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000)
@@ -0,0 +1,40 @@
+"""pipe_iter: 제너레이터 체인 vs fuse=True 퓨전 루프의 원소당 시간(ns).
+
+실행:
+    uv run python benchmarks/bench_pipe_iter_fusion.py [n]
+"""
+from __future__ import annotations
+
+import sys
+import time
+from collections import deque
+
+from fp_learning.assignments_04 import filter_stage, map_stage, pipe_iter
+
+
+def _stages(k: int):
+    # map/filter 를 번갈아 배치 (filter 는 모두 통과시켜 원소 수를 유지)
+    return [map_stage(lambda x: x + 1) if i % 2 == 0 else filter_stage(lambda x: x >= 0)
+            for i in range(k)]
+
+
+def _ns_per_elem(n: int, stages, fuse: bool) -> float:
+    best = float("inf")
+    for _ in range(3):
+        t0 = time.perf_counter_ns()
+        deque(pipe_iter(range(n), *stages, fuse=fuse), maxlen=0)
+        best = min(best, (time.perf_counter_ns() - t0) / n)
+    return best
+
+
+def main(n: int = 1_000_000) -> None:
+    print(f"{'stages':>6} {'chain ns/elem':>14} {'fused ns/elem':>14} {'speedup':>8}")
+    for k in (1, 5, 20):
+        stages = _stages(k)
+        chain = _ns_per_elem(n, stages, fuse=False)
+        fused = _ns_per_elem(n, stages, fuse=True)
+        print(f"{k:>6} {chain:>14.1f} {fused:>14.1f} {chain / fused:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
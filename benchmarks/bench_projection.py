@@ -0,0 +1,46 @@
+"""assignments_03: 깊은 문서에서 경로 5~50개 추출 — safe_get_in 반복 vs project().
+
+실행:
+    uv run python benchmarks/bench_projection.py [n_docs]
+"""
+from __future__ import annotations
+
+import sys
+import timeit
+
+from fp_learning.assignments_03 import project, safe_get_in
+
+DEPTH = 6
+FANOUT = 4
+
+
+def _doc(depth: int = DEPTH) -> dict:
+    if depth == 0:
+        return {f"f{i}": i for i in range(FANOUT)}
+    return {f"k{i}": _doc(depth - 1) for i in range(FANOUT)}
+
+
+def _paths(m: int) -> list[list[str]]:
+    # 앞쪽 접두사를 많이 공유하는 경로들 (실제 레코드의 필드 묶음과 비슷하게)
+    out = []
+    for j in range(m):
+        prefix = [f"k{(j >> (2 * (DEPTH - 1 - level))) % FANOUT}" for level in range(DEPTH)]
+        out.append(prefix + [f"f{(j * 7) % FANOUT}"])
+    return out
+
+
+def main(n_docs: int = 20_000) -> None:
+    docs = [_doc()] * n_docs
+    print(f"depth={DEPTH + 1} docs={n_docs}")
+    print(f"{'paths':>6} {'safe_get_in(s)':>15} {'project(s)':>11} {'speedup':>8}")
+    for m in (5, 10, 20, 50):
+        paths = _paths(m)
+        proj = project(paths)
+        t_rep = min(timeit.repeat(lambda: [tuple(safe_get_in(d, p) for p in paths) for d in docs],
+                                  number=1, repeat=3))
+        t_proj = min(timeit.repeat(lambda: [proj(d) for d in docs], number=1, repeat=3))
+        print(f"{m:>6} {t_rep:>15.3f} {t_proj:>11.3f} {t_rep / t_proj:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
@@ -0,0 +1,60 @@
+"""assignments_05: list[Result] vs ResultArray — 메모리(tracemalloc)와 처리량.
+
+실행:
+    uv run python benchmarks/bench_result_array.py [n]
+
+기본 n = 10_000_000, 1% 가 Err.
+"""
+from __future__ import annotations
+
+import sys
+import time
+import tracemalloc
+
+from fp_learning import assignments_05 as A_05
+
+
+def _results(n: int):
+    return (A_05.err(f"bad row {i}") if i % 100 == 0 else A_05.ok(float(i)) for i in range(n))
+
+
+def _measure(build):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    obj = build()
+    secs = time.perf_counter() - t0
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, size, secs
+
+
+def _timed(fn) -> float:
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+
+def main(n: int = 10_000_000) -> None:
+    double = A_05.ok(lambda x: x * 2)
+    rows, size_list, t_list = _measure(lambda: list(_results(n)))
+    print(f"list[Result]        : {size_list / n:6.1f} B/elem  build {t_list:.2f}s")
+    t = _timed(lambda: [A_05.result_apply(r, double) for r in rows])
+    print(f"  apply x2          : {t:.3f}s")
+    del rows
+
+    ra, size_arr, t_arr = _measure(lambda: A_05.ResultArray.from_results(_results(n)))
+    print(f"ResultArray(array)  : {size_arr / n:6.1f} B/elem  build {t_arr:.2f}s")
+    t = _timed(lambda: ra.apply(double))
+    print(f"  apply x2          : {t:.3f}s")
+
+    try:
+        import numpy as np
+    except ImportError:
+        return
+    rn = A_05.ResultArray(np.frombuffer(ra.values, dtype="d"), ra.errors)
+    t = _timed(lambda: rn.apply(A_05.ok(lambda xs: xs * 2)))
+    print(f"ResultArray(numpy)  : apply x2 {t:.3f}s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000)
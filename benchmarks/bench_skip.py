@@ -0,0 +1,32 @@
+"""assignments_02: SupportsISlice 빠른 경로 — drop(n, ...) 시간이 n 과 무관한지 확인.
+
+실행:
+    uv run python benchmarks/bench_skip.py
+
+generic 열은 같은 소스를 일반 이터레이터로 감싸(iter(...)) 빠른 경로를 끈 결과.
+"""
+from __future__ import annotations
+
+import time
+
+from fp_learning.assignments_02 import Countdown, drop
+
+
+def _first_after_drop(n: int, src) -> tuple[float, int]:
+    t0 = time.perf_counter()
+    value = next(drop(n, src))
+    return time.perf_counter() - t0, value
+
+
+def main() -> None:
+    print(f"{'n':>15} {'range us':>10} {'Countdown us':>13} {'generic(range) s':>17}")
+    for n in (10**3, 10**6, 10**7, 10**9, 10**12):
+        t_range, _ = _first_after_drop(n, range(n + 1))
+        t_cd, _ = _first_after_drop(n, Countdown(n + 1))
+        # 일반 경로는 n개를 실제로 꺼내므로 큰 n 은 생략
+        generic = f"{_first_after_drop(n, iter(range(n + 1)))[0]:.3f}" if n <= 10**7 else "-"
+        print(f"{n:>15,} {t_range * 1e6:>10.1f} {t_cd * 1e6:>13.1f} {generic:>17}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Maybe/Result 깊은 바인딩: 재귀 flatmap vs run_maybe / run_result (깊이 10, 1k, 100k).
+
+재귀 방식은 깊이에 비례해 파이썬 프레임이 쌓이므로 깊어지면 RecursionError 가 난다.
+Just.flatmap 은 예외를 Nothing 으로 바꾸므로 재귀 Maybe 는 조용히 틀린 결과(Nothing)를 낸다.
+
+실행:
+    uv run python benchmarks/bench_trampoline.py
+"""
+from __future__ import annotations
+
+import functools
+import timeit
+
+from fp_learning import assignments_03 as A_03
+from fp_learning import assignments_05 as A_05
+
+
+def _recursive_maybe(n: int) -> A_03.Maybe[int]:
+    if n == 0:
+        return A_03.Just(0)
+    return A_03.Just(n).flatmap(lambda v: _recursive_maybe(v - 1))
+
+
+def _trampolined_maybe(n: int):
+    if n == 0:
+        return A_03.Just(0)
+    return A_03.bind(A_03.Just(n), lambda v: _trampolined_maybe(v - 1))
+
+
+def _recursive_result(n: int):
+    if n == 0:
+        return A_05.ok(0)
+    r = A_05.ok(n)
+    return _recursive_result(r.value - 1) if A_05.is_ok(r) else r
+
+
+def _trampolined_result(n: int):
+    if n == 0:
+        return A_05.ok(0)
+    return A_05.result_bind(A_05.ok(n), lambda v: _trampolined_result(v - 1))
+
+
+def _per_step_us(fn, depth: int, expected: object) -> str:
+    number = max(1, 100_000 // depth)
+    try:
+        if fn() != expected:
+            return "wrong result"
+        secs = min(timeit.repeat(fn, number=number, repeat=3))
+    except RecursionError:
+        return "RecursionError"
+    return f"{secs / number / depth * 1e6:.3f}"
+
+
+def main() -> None:
+    inc = lambda n: A_03.Just(n + 1)
+    ok_inc = lambda n: A_05.ok(n + 1)
+    print(f"{'depth':>7} {'case':>28} {'us/step':>15}")
+    for depth in (10, 1_000, 100_000):
+        chain = [inc] * depth
+        ok_chain = [ok_inc] * depth
+        j0, j_depth, ok0, ok_depth = A_03.Just(0), A_03.Just(depth), A_05.ok(0), A_05.ok(depth)
+        cases = [
+            ("maybe recursive flatmap", lambda: _recursive_maybe(depth), j0),
+            ("maybe run_maybe(recursive)", lambda: A_03.run_maybe(_trampolined_maybe(depth)), j0),
+            ("maybe run_maybe(reduce)", lambda: A_03.run_maybe(functools.reduce(A_03.bind, chain, j0)), j_depth),
+            ("result recursive", lambda: _recursive_result(depth), ok0),
+            ("result run_result(recursive)", lambda: A_05.run_result(_trampolined_result(depth)), ok0),
+            ("result run_result(reduce)",
+             lambda: A_05.run_result(functools.reduce(A_05.result_bind, ok_chain, ok0)), ok_depth),
+        ]
+        for name, fn, expected in cases:
+            print(f"{depth:>7} {name:>28} {_per_step_us(fn, depth, expected):>15}")
+
+
+if __name__ == "__main__":
+    main()
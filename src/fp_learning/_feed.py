@@ -0,0 +1,76 @@
+# path: fp_learning/_feed.py
+"""스레드/태스크 사이 큐로 원소를 넘길 때 쓰는 공용 표식과 읽기 스레드 (내부용).
+
+batched_timed / prefetch(스레드)와 aio 의 파이프라인(태스크)이 같은 규약을 쓴다.
+- 정상 종료: 큐에 DONE
+- 상류 예외: 큐에 Raised(예외) -> 소비자 쪽에서 다시 raise
+"""
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from collections.abc import Iterator
+from typing import Any
+
+__all__ = ["DONE", "Raised", "read_into", "stop_reader"]
+
+DONE = object()
+
+
+class Raised:
+    """상류에서 발생한 예외를 큐를 통해 소비자 쪽으로 전달하기 위한 래퍼."""
+    __slots__ = ("exc",)
+
+    def __init__(self, exc: BaseException):
+        self.exc = exc
+
+
+def read_into(
+    it: Iterator[Any],
+    q: "queue.Queue[Any]",
+    stop: threading.Event,
+    *,
+    stamp: bool = False,
+) -> None:
+    """
+    읽기 스레드 본체: it 을 끝까지(또는 stop 까지) 읽어 q 에 넣는다.
+
+    - stamp=True 면 (time.monotonic() 수신 시각, 원소) 쌍을 넣는다.
+    - 큐가 가득 차 있으면 stop 을 확인하며 기다린다.
+    - 끝나면 이 스레드에서 it.close() 를 호출한다 (제너레이터는 실행하던 스레드에서 닫아야 함).
+    """
+
+    def put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.05)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    try:
+        try:
+            for x in it:
+                if not put((time.monotonic(), x) if stamp else x):
+                    return
+        except BaseException as e:
+            put(Raised(e))
+            return
+        put(DONE)
+    finally:
+        close = getattr(it, "close", None)
+        if close is not None:
+            close()
+
+
+def stop_reader(reader: threading.Thread, q: "queue.Queue[Any]", stop: threading.Event) -> None:
+    """중단 신호 -> 큐를 비워 put 에서 막힌 스레드를 깨움 -> 상류 close 까지 끝나면 join."""
+    stop.set()
+    while reader.is_alive():
+        try:
+            q.get(timeout=0.05)
+        except queue.Empty:
+            pass
+    reader.join()
@@ -0,0 +1,282 @@
+# path: fp_learning/aio.py
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable
+from typing import Any, Tuple, TypeVar
+
+from fp_learning._feed import DONE, Raised
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+__all__ = [
+    "ACountdown",
+    "aiter_of",
+    "abatched",
+    "abatched_timed",
+    "atake",
+    "adrop",
+    "alazy_flatmap",
+    "apipe_iter",
+]
+
+
+class ACountdown:
+    """
+    ACountdown(n): n, n-1, ..., 1 을 지연 산출하는 비동기 이터레이터 (Countdown 대응).
+
+    - n <= 0 이면 아무 것도 산출하지 않음.
+    - __aiter__/__anext__ 를 직접 구현.
+    """
+
+    def __init__(self, n: int):
+        if not isinstance(n, int):
+            raise TypeError
+        self.n = n
+
+    def __aiter__(self) -> "ACountdown":
+        return self
+
+    async def __anext__(self) -> int:
+        if self.n <= 0:
+            raise StopAsyncIteration
+        value = self.n
+        self.n -= 1
+        return value
+
+
+async def aiter_of(xs: Iterable[T] | AsyncIterable[T]) -> AsyncIterator[T]:
+    """동기/비동기 이터러블을 모두 비동기 이터레이터로 맞춘다."""
+    if isinstance(xs, AsyncIterable):
+        async for x in xs:
+            yield x
+    else:
+        for x in xs:
+            yield x
+
+
+def _aiter(xs: Iterable[T] | AsyncIterable[T]) -> AsyncIterator[T]:
+    # 이미 비동기 이터러블이면 래핑 없이 그대로 사용한다.
+    if isinstance(xs, AsyncIterable):
+        return aiter(xs)
+    return aiter_of(xs)
+
+
+async def abatched(aiterable: Iterable[T] | AsyncIterable[T], k: int) -> AsyncIterator[Tuple[T, ...]]:
+    """
+    batched 의 비동기 버전: 길이 k의 튜플로 묶어 지연 산출한다.
+
+    - 마지막 배치는 k보다 짧을 수 있음.
+    - k <= 0 이면 ValueError.
+    - 무한 비동기 이터러블과도 안전.
+    """
+    if k <= 0:
+        raise ValueError
+    it = _aiter(aiterable)
+    batch: list[T] = []
+    async for x in it:
+        batch.append(x)
+        if len(batch) == k:
+            yield tuple(batch)
+            batch = []
+    if batch:
+        yield tuple(batch)
+
+
+async def atake(n: int, ait: Iterable[T] | AsyncIterable[T]) -> AsyncIterator[T]:
+    """
+    take 의 비동기 버전: 앞에서 n개만 지연 산출한다.
+
+    - n <= 0 이면 아무 것도 산출하지 않음.
+    - n개를 산출한 뒤 원본에서 더 꺼내지 않음.
+    """
+    if n <= 0:
+        return
+    it = _aiter(ait)
+    for __ in range(n):
+        try:
+            yield await anext(it)
+        except StopAsyncIteration:
+            return
+
+
+async def adrop(n: int, ait: Iterable[T] | AsyncIterable[T]) -> AsyncIterator[T]:
+    """
+    drop 의 비동기 버전: 앞에서 n개를 건너뛴 나머지를 지연 산출한다.
+
+    - n <= 0 이면 원본 전체 산출.
+    """
+    it = _aiter(ait)
+    for __ in range(max(n, 0)):
+        try:
+            await anext(it)
+        except StopAsyncIteration:
+            return
+    async for x in it:
+        yield x
+
+
+async def alazy_flatmap(
+    fn: Callable[[T], Iterable[U] | AsyncIterable[U]],
+    xs: Iterable[T] | AsyncIterable[T],
+) -> AsyncIterator[U]:
+    """
+    lazy_flatmap 의 비동기 버전.
+
+    - fn(x) 는 동기 또는 비동기 이터러블을 반환할 수 있음.
+    - 무한 입력과도 안전 (필요한 만큼만 펼침).
+    """
+    async for x in _aiter(xs):
+        async for y in _aiter(fn(x)):
+            yield y
+
+
+# -----------------------------
+# 비동기 파이프라인
+# -----------------------------
+async def _pump(src: AsyncIterator[Any], q: asyncio.Queue[Any]) -> None:
+    try:
+        async for x in src:
+            await q.put(x)
+    except asyncio.CancelledError:
+        raise
+    except BaseException as e:
+        await q.put(Raised(e))
+        return
+    finally:
+        aclose = getattr(src, "aclose", None)
+        if aclose is not None:
+            await aclose()
+    await q.put(DONE)
+
+
+async def _drain(q: asyncio.Queue[Any]) -> AsyncIterator[Any]:
+    while True:
+        x = await q.get()
+        if x is DONE:
+            return
+        if isinstance(x, Raised):
+            raise x.exc
+        yield x
+
+
+async def apipe_iter(
+    data: Iterable[T] | AsyncIterable[T],
+    *stages: Callable[[AsyncIterator[Any]], AsyncIterable[Any]],
+    buffer: int = 0,
+) -> AsyncIterator[Any]:
+    """
+    pipe_iter 의 비동기 버전:
+        apipe_iter(data, s1, s2) == s2(s1(data)) 를 '지연'으로 수행
+
+    요구사항
+    - 각 stage는 (AsyncIterator[X]) -> AsyncIterable[Y] 형태.
+    - buffer <= 0 (기본): 단순 체인. 소비자가 당길 때만 상류가 진행.
+    - buffer > 0: 소스와 각 stage를 별도 태스크로 돌리고, 사이를 크기 buffer의
+      asyncio.Queue 로 연결해 느린 stage와 I/O 대기 생산자가 겹쳐 실행되게 함.
+      상류는 하류보다 최대 buffer개(+처리 중 1개)까지만 앞서 나감.
+    - 상류 예외는 하류로 그대로 전달되고, 소비자가 중간에 멈추면 모든 태스크를 취소.
+    """
+    src: AsyncIterator[Any] = _aiter(data)
+    if buffer <= 0:
+        for stage in stages:
+            src = _aiter(stage(src))
+        async for x in src:
+            yield x
+        return
+
+    tasks: list[asyncio.Task[None]] = []
+    try:
+        for stage in (None, *stages):
+            if stage is not None:
+                src = _aiter(stage(src))
+            q: asyncio.Queue[Any] = asyncio.Queue(maxsize=buffer)
+            tasks.append(asyncio.create_task(_pump(src, q)))
+            src = _drain(q)
+        async for x in src:
+            yield x
+    finally:
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+# -----------------------------
+# 크기 + 시간 제한 배치
+# -----------------------------
+async def _stamped(src: AsyncIterator[T]) -> AsyncIterator[tuple[float, T]]:
+    loop = asyncio.get_running_loop()
+    async for x in src:
+        yield loop.time(), x
+
+
+def _top_up(q: asyncio.Queue[Any], batch: list[Any], k: int) -> Any:
+    """기다리지 않고 큐에 있는 원소로 batch 를 k개까지 채운다. 종료/예외 표식을 만나면 돌려준다."""
+    while len(batch) < k:
+        try:
+            item = q.get_nowait()
+        except asyncio.QueueEmpty:
+            return None
+        if item is DONE or isinstance(item, Raised):
+            return item
+        batch.append(item[1])
+    return None
+
+
+async def abatched_timed(
+    aiterable: Iterable[T] | AsyncIterable[T],
+    k: int,
+    max_wait: float,
+) -> AsyncIterator[Tuple[T, ...]]:
+    """
+    batched_timed 의 비동기 버전: 최대 k개 또는 최대 max_wait초 중 먼저 도달하는 쪽에서 flush.
+
+    - 배치의 첫 원소 수신 시각부터 max_wait초 안에 그 배치를 내보냄.
+    - 소비자가 늦어 마감이 지났으면 이미 쌓인 원소로 k개까지 채워 내보냄.
+    - k <= 0 또는 max_wait < 0 이면 ValueError.
+    - 소스는 별도 태스크에서 읽으며 미리 읽는 양은 k개로 제한.
+    - 소비자가 중간에 멈추면 읽기 태스크를 취소.
+    """
+    if k <= 0 or max_wait < 0:
+        raise ValueError
+    loop = asyncio.get_running_loop()
+    q: asyncio.Queue[Any] = asyncio.Queue(maxsize=k)
+    reader = asyncio.create_task(_pump(_stamped(_aiter(aiterable)), q))
+    batch: list[T] = []
+    deadline = 0.0
+    try:
+        while True:
+            if batch:
+                item = None
+                timeout = deadline - loop.time()
+                if timeout > 0:
+                    try:
+                        item = await asyncio.wait_for(q.get(), timeout)
+                    except TimeoutError:
+                        pass
+                if item is None:
+                    # 마감 경과: 이미 쌓인 원소를 기다림 없이 k개까지 채워서 내보낸다.
+                    item = _top_up(q, batch, k)
+                    yield tuple(batch)
+                    batch = []
+                    if item is None:
+                        continue
+            else:
+                item = await q.get()
+            if item is DONE:
+                if batch:
+                    yield tuple(batch)
+                return
+            if isinstance(item, Raised):
+                raise item.exc
+            arrived, value = item
+            if not batch:
+                deadline = arrived + max_wait
+            batch.append(value)
+            if len(batch) == k:
+                yield tuple(batch)
+                batch = []
+    finally:
+        reader.cancel()
+        await asyncio.gather(reader, return_exceptions=True)
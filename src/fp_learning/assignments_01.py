@@ -1,5 +1,12 @@
-from collections.abc import Iterable
-from typing import List
+from array import array
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import Any, List
+
+try:  # numpy는 선택 의존성: 없으면 배열 백엔드는 리스트 경로로 폴백한다.
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy 미설치 환경
+    np = None
 
 def assignment1(nums: Iterable[int]) -> List[int]:
     """
@@ -21,3 +28,101 @@ def assignment3(nums: Iterable[float | int]) -> List[float]:
     규칙: 각 원소를 절반으로
     """
     return list(map(lambda x: x/2, nums))
+
+
+# -----------------------------
+# 배열 백엔드 (opt-in)
+# -----------------------------
+def _as_ndarray(xs: Any) -> Any:
+    """ndarray 또는 버퍼 프로토콜 입력을 복사 없이 ndarray로 본다. 불가능하면 None."""
+    if np is None:
+        return None
+    if isinstance(xs, np.ndarray):
+        return xs
+    try:
+        view = memoryview(xs)
+    except TypeError:
+        return None
+    return np.asarray(view)
+
+def assignment1_array(nums: Any) -> Any:
+    """
+    assignment1의 배열 버전: 한 번의 벡터 연산으로 세제곱한다.
+
+    - ndarray / 버퍼 프로토콜 입력(array.array, bytes 등) -> ndarray 반환
+    - 그 외 이터러블 -> assignment1 (List[int]) 로 폴백
+    - 64비트보다 좁은 정수/불리언 입력(bytes, array('i') 등)은 int64 로 올려 계산한다.
+    주의: int64/uint64 입력은 그대로 계산하므로 세제곱이 64비트를 넘으면 오버플로된다.
+    """
+    arr = _as_ndarray(nums)
+    if arr is None:
+        return assignment1(nums)
+    if arr.dtype.kind in "biu" and arr.dtype.itemsize < 8:
+        return np.power(arr, 3, dtype=np.int64)
+    return np.power(arr, 3)
+
+def assignment2_array(words: Any) -> Any:
+    """
+    assignment2의 배열 버전: 문자열 배열(dtype 'U'/'S')의 길이를 한 번에 계산한다.
+
+    - 문자열 dtype ndarray -> int ndarray 반환
+    - object dtype ndarray -> len을 적용한 int ndarray 반환
+    - 그 외 이터러블 -> assignment2 (List[int]) 로 폴백
+    """
+    if np is None or not isinstance(words, np.ndarray):
+        return assignment2(words)
+    if words.dtype.kind in "US":
+        return np.char.str_len(words)
+    return np.fromiter(map(len, words.ravel()), dtype=np.intp, count=words.size).reshape(words.shape)
+
+def assignment3_array(nums: Any) -> Any:
+    """
+    assignment3의 배열 버전: 한 번의 벡터 연산으로 절반을 계산한다.
+
+    - ndarray / 버퍼 프로토콜 입력 -> float ndarray 반환
+    - 그 외 이터러블 -> assignment3 (List[float]) 로 폴백
+    """
+    arr = _as_ndarray(nums)
+    if arr is None:
+        return assignment3(nums)
+    return np.true_divide(arr, 2)
+
+
+# -----------------------------
+# 스트리밍 / 청크 버전 (메모리 일정)
+# -----------------------------
+def iter_assignment1(nums: Iterable[int]) -> Iterator[int]:
+    """assignment1의 지연 버전: 무한 이터러블에도 안전하다."""
+    return map(lambda x: x**3, nums)
+
+def iter_assignment2(words: Iterable[str]) -> Iterator[int]:
+    """assignment2의 지연 버전: 무한 이터러블에도 안전하다."""
+    return map(len, words)
+
+def iter_assignment3(nums: Iterable[float | int]) -> Iterator[float]:
+    """assignment3의 지연 버전: 무한 이터러블에도 안전하다."""
+    return map(lambda x: x/2, nums)
+
+def _chunked(typecode: str, mapped: Iterator[Any], size: int) -> Iterator[array]:
+    if size <= 0:
+        raise ValueError
+    while chunk := array(typecode, islice(mapped, size)):
+        yield chunk
+
+def chunked_assignment1(nums: Iterable[int], size: int = 65536) -> Iterator[array]:
+    """
+    세제곱 결과를 길이 size의 array('q') 청크로 지연 산출한다.
+
+    - 마지막 청크는 size보다 짧을 수 있음.
+    - size <= 0 이면 ValueError.
+    - 결과가 int64 범위를 넘으면 OverflowError.
+    """
+    return _chunked("q", iter_assignment1(nums), size)
+
+def chunked_assignment2(words: Iterable[str], size: int = 65536) -> Iterator[array]:
+    """문자열 길이를 길이 size의 array('q') 청크로 지연 산출한다."""
+    return _chunked("q", iter_assignment2(words), size)
+
+def chunked_assignment3(nums: Iterable[float | int], size: int = 65536) -> Iterator[array]:
+    """절반 값을 길이 size의 array('d') 청크로 지연 산출한다."""
+    return _chunked("d", iter_assignment3(nums), size)
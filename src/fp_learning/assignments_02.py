@@ -1,11 +1,64 @@
 # fp_learning/assignments_02.py
 from __future__ import annotations
 
-from collections.abc import Iterable, Iterator
+from collections.abc import Callable, Iterable, Iterator
 import functools
-from typing import TypeVar, Tuple
+import itertools
+import queue
+import threading
+import time
+from typing import Any, Protocol, TypeVar, Tuple, runtime_checkable
+
+from fp_learning._feed import DONE, Raised, read_into
+
+try:  # numpy는 선택 의존성: 있으면 ndarray 입력을 배열 뷰로 자른다.
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy 미설치 환경
+    np = None
 
 T = TypeVar("T")
+T_co = TypeVar("T_co", covariant=True)
+
+
+# -------------------------
+# 빠른 건너뛰기/자르기 프로토콜
+# -------------------------
+@runtime_checkable
+class SupportsISlice(Protocol[T_co]):
+    """
+    소스가 '위치로 바로 이동'할 수 있음을 알리는 프로토콜.
+
+    obj.islice(start, stop=None) 는 itertools.islice(obj, start, stop) 과 같은 원소를
+    산출하되, 앞의 start 개를 꺼내 버리지 않고 바로 건너뛴다.
+    - 이터레이터형 소스(iter(obj) is obj, 예: Countdown): 현재 위치 기준이며,
+      호출 즉시 start 개만큼 진행하고 반환된 이터레이터를 소비하는 만큼 더 진행.
+    - 시퀀스형 소스(예: MappedLines): 처음 기준이며 상태가 없다.
+    drop/take/batched(와 *_fast)는 타입에 이 메서드가 있으면 빠른 경로를 쓴다
+    (판별은 getattr(type(obj), "islice") 로 하며 이 클래스는 타입 표기용).
+    range/list/tuple 은 내장 어댑터로 같은 경로를 탄다.
+    """
+
+    def islice(self, start: int, stop: int | None = None) -> Iterator[T_co]: ...
+
+
+def _seq_islice(seq: Any, start: int, stop: int | None = None) -> Iterator[Any]:
+    if type(seq) is range:
+        return iter(seq[start:stop])
+    it = iter(seq)
+    it.__setstate__(start)  # list/tuple 이터레이터의 위치를 O(1)로 지정
+    return it if stop is None else itertools.islice(it, max(stop - start, 0))
+
+
+def _islicer(obj: Any) -> Callable[..., Iterator[Any]] | None:
+    """빠른 자르기가 가능한 소스면 (start, stop) -> Iterator 함수를, 아니면 None."""
+    cls = type(obj)
+    if cls in (range, list, tuple):
+        return functools.partial(_seq_islice, obj)
+    # runtime_checkable isinstance 는 호출당 수 µs 라 타입의 속성 조회로 판별한다.
+    method = getattr(cls, "islice", None)
+    if method is None:
+        return None
+    return functools.partial(method, obj)
 
 
 class Countdown:
@@ -33,6 +86,15 @@ class Countdown:
         self.n -= 1
         return value
 
+    def islice(self, start: int, stop: int | None = None) -> Iterator[int]:
+        """SupportsISlice: 앞의 start 개는 카운터만 줄여 O(1)로 건너뛴다."""
+        if start < 0 or (stop is not None and stop < 0):
+            raise ValueError
+        self.n -= min(start, max(self.n, 0))
+        if stop is None:
+            return self
+        return itertools.islice(self, max(stop - start, 0))
+
 
 def batched(iterable: Iterable[T], k: int) -> Iterator[Tuple[T, ...]]:
     """
@@ -43,9 +105,15 @@ def batched(iterable: Iterable[T], k: int) -> Iterator[Tuple[T, ...]]:
     - k <= 0 이면 ValueError.
     - 무한 이터러블(itertools.count 등)과도 안전하게 동작해야 함.
     - list(materialize) 금지. yield 또는 itertools 사용.
+    - SupportsISlice 소스(range/list/tuple 포함)는 islice(0) 을 한 번만 호출해 그 이터레이터를 묶는다.
     """
     if k <= 0:
         raise ValueError
+    sl = _islicer(iterable)
+    if sl is not None:
+        # 빠른 경로: 배치는 건너뛸 것이 없으므로 소스 이터레이터를 한 번만 얻어 C 루프로 묶는다.
+        yield from itertools.batched(sl(0), k)
+        return
     it = iter(iterable)
     while True:
         batch = []
@@ -68,10 +136,15 @@ def take(n: int, it: Iterable[T]) -> Iterator[T]:
     - n <= 0 이면 아무 것도 산출하지 않음.
     - itertools.islice 또는 iter/next를 활용.
     - list(materialize) 금지.
+    - SupportsISlice 소스(range/list/tuple 포함)는 소스의 islice 경로 사용.
     """
     if n <= 0:
         return
 
+    sl = _islicer(it)
+    if sl is not None:
+        yield from sl(0, n)
+        return
     it = iter(it)
     for __ in range(n):
         try:
@@ -89,7 +162,14 @@ def drop(n: int, it: Iterable[T]) -> Iterator[T]:
     - n <= 0 이면 원본 전체 산출.
     - 무한 이터러블과 함께 사용해도 멈추지 않아야 함.
     - list(materialize) 금지.
+    - SupportsISlice 소스(range/list/tuple, Countdown, mmap 소스)는 n개를 꺼내지 않고
+      바로 건너뜀: drop(10**9, range(...)) 도 상수 시간.
     """
+    sl = _islicer(it)
+    if sl is not None:
+        # 빠른 경로: 앞의 n개를 꺼내지 않고 바로 그 위치에서 시작
+        yield from sl(max(n, 0))
+        return
     k = 0
     it = iter(it)
     while True:
@@ -99,4 +179,151 @@ def drop(n: int, it: Iterable[T]) -> Iterator[T]:
                 yield value
             k += 1
         except StopIteration:
-            return
\ No newline at end of file
+            return
+
+
+# -------------------------
+# itertools 기반 C 속도 버전
+# -------------------------
+def batched_fast(iterable: Iterable[T], k: int) -> Iterator[Tuple[T, ...]]:
+    """
+    batched와 같은 결과를 itertools.batched(C 구현)로 산출한다.
+
+    - k <= 0 이면 원본과 같이 첫 next 시점에 ValueError.
+    - 지연 산출이며 무한 이터러블과도 안전.
+    """
+    if k <= 0:
+        raise ValueError
+    yield from itertools.batched(iterable, k)
+
+
+def take_fast(n: int, it: Iterable[T]) -> Iterator[T]:
+    """
+    take와 같은 결과를 itertools.islice로 산출한다.
+
+    - n <= 0 이면 아무 것도 산출하지 않음.
+    - n개를 산출한 뒤 원본에서 더 꺼내지 않음 (이어서 소비 가능).
+    - 호출만으로는 원본을 건드리지 않음 (islice 빠른 경로도 첫 next 에서 시작).
+    """
+    sl = _islicer(it)
+    if sl is not None:
+        yield from sl(0, max(n, 0))
+        return
+    yield from itertools.islice(it, max(n, 0))
+
+
+def drop_fast(n: int, it: Iterable[T]) -> Iterator[T]:
+    """
+    drop과 같은 결과를 itertools.islice로 산출한다.
+
+    - n <= 0 이면 원본 전체 산출.
+    - 건너뛴 뒤에는 원소마다 카운터 비교 없이 그대로 흘려보냄.
+    - 호출만으로는 원본을 건드리지 않음 (islice 빠른 경로도 첫 next 에서 시작).
+    """
+    sl = _islicer(it)
+    if sl is not None:
+        yield from sl(max(n, 0))
+        return
+    yield from itertools.islice(it, max(n, 0), None)
+
+
+# -------------------------
+# 버퍼 기반 무복사 배치
+# -------------------------
+def batched_buffer(obj: Any, k: int) -> Iterator[Any]:
+    """
+    버퍼 입력을 길이 k의 '뷰'로 잘라 지연 산출한다 (원소 복사 없음).
+
+    - ndarray -> ndarray 뷰 (obj[i:i+k]), 다차원이면 첫 축 기준.
+    - bytes/bytearray/array.array 등 버퍼 프로토콜 -> memoryview 슬라이스.
+    - 그 외(이터레이터 등) -> batched 와 동일한 튜플 경로.
+    - 마지막 배치는 k보다 짧을 수 있음. k <= 0 이면 ValueError.
+    주의: 뷰가 살아 있는 동안 bytearray 등 원본의 크기를 바꿀 수 없다.
+    """
+    if k <= 0:
+        raise ValueError
+    if np is not None and isinstance(obj, np.ndarray):
+        view = obj
+    else:
+        try:
+            view = memoryview(obj)
+        except TypeError:
+            yield from batched(obj, k)
+            return
+    for start in range(0, len(view), k):
+        yield view[start:start + k]
+
+
+# -------------------------
+# 크기 + 시간 제한 배치 (스레드 소스)
+# -------------------------
+def _top_up(q: "queue.Queue[Any]", batch: list[Any], k: int) -> Any:
+    """기다리지 않고 큐에 있는 원소로 batch 를 k개까지 채운다. 종료/예외 표식을 만나면 돌려준다."""
+    while len(batch) < k:
+        try:
+            item = q.get_nowait()
+        except queue.Empty:
+            return None
+        if item is DONE or isinstance(item, Raised):
+            return item
+        batch.append(item[1])
+    return None
+
+
+def batched_timed(iterable: Iterable[T], k: int, max_wait: float) -> Iterator[Tuple[T, ...]]:
+    """
+    최대 k개 또는 최대 max_wait초 중 먼저 도달하는 쪽에서 배치를 내보낸다.
+
+    요구사항
+    - 배치의 첫 원소가 들어온 시각부터 max_wait초 안에 그 배치를 flush.
+      (소비자가 바로 다음 배치를 기다리고 있다면 수신->flush 지연이 max_wait로 묶임)
+    - 소비자가 늦어 마감이 이미 지났으면 큐에 쌓인 원소를 기다림 없이 k개까지 채워 flush
+      (과부하 때 1개짜리 배치로 처리량이 무너지지 않도록).
+    - k <= 0 또는 max_wait < 0 이면 ValueError.
+    - 소스는 백그라운드 스레드에서 읽으며 미리 읽는 양은 k개로 제한.
+    - 소스의 예외는 batched와 같이 그대로 전파(미완성 배치는 버림).
+    - 소비자가 중간에 멈추면 읽기 스레드에 중단을 알림. 스레드가 소스의 next()
+      안에서 막혀 있다면 다음 원소를 받은 뒤 종료한다 (데몬 스레드).
+    """
+    if k <= 0 or max_wait < 0:
+        raise ValueError
+    q: queue.Queue[Any] = queue.Queue(maxsize=k)
+    stop = threading.Event()
+    reader = threading.Thread(target=read_into, args=(iter(iterable), q, stop), kwargs={"stamp": True}, daemon=True)
+    reader.start()
+    batch: list[T] = []
+    deadline = 0.0
+    try:
+        while True:
+            if batch:
+                item = None
+                timeout = deadline - time.monotonic()
+                if timeout > 0:
+                    try:
+                        item = q.get(timeout=timeout)
+                    except queue.Empty:
+                        pass
+                if item is None:
+                    # 마감 경과: 소비자가 늦어 이미 쌓인 원소가 있으면 k개까지 채워서 내보낸다.
+                    item = _top_up(q, batch, k)
+                    yield tuple(batch)
+                    batch = []
+                    if item is None:
+                        continue
+            else:
+                item = q.get()
+            if item is DONE:
+                if batch:
+                    yield tuple(batch)
+                return
+            if isinstance(item, Raised):
+                raise item.exc
+            arrived, value = item
+            if not batch:
+                deadline = arrived + max_wait
+            batch.append(value)
+            if len(batch) == k:
+                yield tuple(batch)
+                batch = []
+    finally:
+        stop.set()
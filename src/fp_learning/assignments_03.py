@@ -2,8 +2,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import count
 from re import L
-from typing import Callable, Generic, Iterable, Iterator, List, Sequence, TypeVar
+from typing import Any, Callable, Generic, Iterable, Iterator, List, Sequence, TypeVar
+
+try:  # numpy는 선택 의존성: 있으면 문자열 배열을 블록 단위로 벡터 처리한다.
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy 미설치 환경
+    np = None
 
 T = TypeVar("T")
 U = TypeVar("U")
@@ -15,6 +22,7 @@ U = TypeVar("U")
 #  Maybe는 이미 구현되어 있으며 수정할 필요 없습니다.)
 # -----------------------------
 class Maybe(Generic[T]):
+    __slots__ = ()
     def map(self, f: Callable[[T], U]) -> "Maybe[U]":
         raise NotImplementedError
     def flatmap(self, f: Callable[[T], "Maybe[U]"]) -> "Maybe[U]":
@@ -22,16 +30,21 @@ class Maybe(Generic[T]):
     def get_or(self, default: U | T) -> U | T:
         raise NotImplementedError
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Just(Maybe[T]):
     value: T
     def map(self, f: Callable[[T], U]) -> "Maybe[U]":
         try:
-            return Just(f(self.value))
+            y = f(self.value)
         except Exception:
             return Nothing()
+        # 값이 그대로면 새 래퍼를 만들지 않는다.
+        return self if y is self.value else Just(y)
     def flatmap(self, f: Callable[[T], "Maybe[U]"]) -> "Maybe[U]":
         try:
+            if type(f) is _KeepIf:
+                # keep_if 는 값을 바꾸지 않으므로 자기 자신을 그대로 통과시킨다.
+                return self if f.pred(self.value) else Nothing()
             return f(self.value)
         except Exception:
             return Nothing()
@@ -41,6 +54,14 @@ class Just(Maybe[T]):
         return f"Just({self.value!r})"
 
 class Nothing(Maybe[T]):
+    """값 없음. 상태가 없으므로 Nothing()은 항상 같은 싱글턴을 돌려준다."""
+    __slots__ = ()
+    _instance: "Nothing[object] | None" = None
+    def __new__(cls) -> "Nothing[T]":
+        inst = cls._instance
+        if inst is None:
+            inst = cls._instance = super().__new__(cls)
+        return inst
     def map(self, f: Callable[[T], U]) -> "Maybe[U]":
         return self  # 그대로 Nothing
     def flatmap(self, f: Callable[[T], "Maybe[U]"]) -> "Maybe[U]":
@@ -54,6 +75,48 @@ def maybe(x: T | None) -> Maybe[T]:
     return Nothing() if x is None else Just(x)
 
 
+# -----------------------------
+# 스택 안전(trampolined) flatmap
+# -----------------------------
+# frozen 은 생성 비용(object.__setattr__)이 커서 쓰지 않는다. 만든 뒤 바꾸지 말 것.
+@dataclass(slots=True, eq=False)
+class Bind(Generic[T, U]):
+    """`source.flatmap(fn)` 을 '설명'만 하는 값. run_maybe 가 반복문으로 실행한다.
+
+    fn 은 Maybe 또는 또 다른 Bind 를 돌려줄 수 있어 재귀적인 워크플로도 스택이 쌓이지 않는다.
+    """
+    source: "Maybe[T] | Bind[object, T]"
+    fn: "Callable[[T], Maybe[U] | Bind[object, U]]"
+
+def bind(m: "Maybe[T] | Bind[object, T]", f: "Callable[[T], Maybe[U] | Bind[object, U]]") -> Bind[T, U]:
+    return Bind(m, f)
+
+def run_maybe(prog: "Maybe[T] | Bind[object, T]") -> Maybe[T]:
+    """Bind 로 만든 프로그램을 상수 스택으로 실행한다.
+
+    - 결과는 같은 flatmap 체인을 직접 호출한 것과 같음.
+    - Nothing 이 나오면 남은 단계를 모두 건너뛴다.
+    - 단계 함수에서 예외가 나면 Just.flatmap 처럼 Nothing.
+    예)
+      run_maybe(functools.reduce(bind, [f] * 100_000, Just(0)))   # RecursionError 없음
+    """
+    pending: list[Callable[[object], object]] = []
+    cur: object = prog
+    while True:
+        if type(cur) is Bind:
+            # 왼쪽으로 중첩된 Bind 는 이어서 실행할 함수만 쌓아 두고 source 로 내려간다.
+            pending.append(cur.fn)
+            cur = cur.source
+            continue
+        if not pending or not isinstance(cur, Just):
+            return cur  # type: ignore[return-value]
+        f = pending.pop()
+        try:
+            cur = f(cur.value)
+        except Exception:
+            return Nothing()
+
+
 # -----------------------------
 # Assignment 1: lazy_flatmap
 # -----------------------------
@@ -87,16 +150,210 @@ def safe_get_in(d: dict, path: Sequence[str]) -> Maybe[object]:
       user = {'profile': {'email': 'a@b.com'}}
       safe_get_in(user, ['profile', 'email']) -> Just('a@b.com')
       safe_get_in(user, ['profile', 'phone']) -> Nothing()
+    - 0, "", {} 같은 falsy 값은 정상 값이다. 키가 없거나 값이 None일 때만 Nothing.
     """
     for path_item in path:
         value = d.get(path_item)
-        if value:
-            d = value
-        else:
+        if value is None:
             return Nothing()
+        d = value
     return Just(d)
-    
-    
+
+
+# -----------------------------
+# 컴파일된 경로 접근자 (safe_get_in 대량 처리용)
+# -----------------------------
+_MISSING = object()
+
+@lru_cache(maxsize=128)
+def _path_getter_factory(depth: int, wrap: bool) -> Callable[..., Callable[[object], object]]:
+    """경로 길이마다 한 번만 직선 코드(루프 없음) 접근자 팩토리를 생성한다.
+
+    키가 없거나 값이 None이거나 중간 값이 dict가 아니면(.get 없음) '없음'.
+    wrap=False: 값 또는 _MISSING 반환 / wrap=True: Just(값) 또는 Nothing() 반환.
+    """
+    miss, hit = ("_NOTHING", "_Just(d)") if wrap else ("_MISSING", "d")
+    keys = [f"k{i}" for i in range(depth)]
+    lines = [f"def _make({', '.join(keys)}):", "    def get(d):", "        try:", "            pass"]
+    for k in keys:
+        lines += [
+            f"            d = d.get({k}, _MISSING)",
+            f"            if d is _MISSING or d is None: return {miss}",
+        ]
+    lines += ["        except AttributeError:", f"            return {miss}", f"        return {hit}", "    return get"]
+    namespace: dict[str, object] = {"_MISSING": _MISSING, "_NOTHING": Nothing(), "_Just": Just}
+    exec(compile("\n".join(lines), f"<path getter depth={depth}>", "exec"), namespace)
+    return namespace["_make"]  # type: ignore[return-value]
+
+def _normalize_path(path: Sequence[str] | str) -> tuple[str, ...]:
+    # "a.b.c" 문자열 경로도 허용한다.
+    return tuple(path.split(".")) if isinstance(path, str) else tuple(path)
+
+@lru_cache(maxsize=1024)
+def _compile_raw(path: tuple[str, ...]) -> Callable[[object], object]:
+    return _path_getter_factory(len(path), False)(*path)
+
+@lru_cache(maxsize=1024)
+def _compile_maybe(path: tuple[str, ...]) -> Callable[[dict], Maybe[object]]:
+    return _path_getter_factory(len(path), True)(*path)  # type: ignore[return-value]
+
+def compile_path(path: Sequence[str] | str) -> Callable[[dict], Maybe[object]]:
+    """경로를 한 번 컴파일해 getter(d) -> Maybe 를 돌려준다 (LRU 캐시).
+
+    - 같은 경로는 캐시된 getter를 재사용한다 (list/tuple/"a.b.c" 모두 같은 키).
+    - safe_get_in 과 같은 규칙: 키가 없거나 값이 None이면 Nothing, falsy 값은 Just.
+    - 중간 값이 dict가 아니면 예외 대신 Nothing.
+    예)
+      get_email = compile_path("profile.email")
+      get_email({'profile': {'email': 'a@b.com'}}) -> Just('a@b.com')
+    """
+    return _compile_maybe(_normalize_path(path))
+
+def get_in_many(
+    records: Iterable[dict],
+    path: Sequence[str] | str,
+    *,
+    dense: bool = False,
+    default: object = None,
+) -> List[Maybe[object]] | tuple[List[object], List[bool]]:
+    """여러 레코드에 같은 경로 getter 하나를 적용한다.
+
+    - dense=False: List[Maybe] (Just/Nothing)
+    - dense=True : (values, mask). 값이 없는 자리는 values 에 default, mask 에 False.
+      원소마다 Maybe 를 만들지 않는다.
+    """
+    key = _normalize_path(path)
+    if not dense:
+        return list(map(_compile_maybe(key), records))
+    raws = list(map(_compile_raw(key), records))
+    values = [default if v is _MISSING else v for v in raws]
+    mask = [v is not _MISSING for v in raws]
+    return values, mask
+
+
+# -----------------------------
+# 다중 경로 프로젝션 (접두사 트라이, 레코드당 1회 순회)
+# -----------------------------
+class _TrieNode:
+    __slots__ = ("outputs", "children")
+    def __init__(self) -> None:
+        self.outputs: List[int] = []
+        self.children: dict[str, _TrieNode] = {}
+
+def _build_trie(paths: tuple[tuple[str, ...], ...]) -> _TrieNode:
+    root = _TrieNode()
+    for i, path in enumerate(paths):
+        node = root
+        for key in path:
+            node = node.children.setdefault(key, _TrieNode())
+        node.outputs.append(i)
+    return root
+
+@lru_cache(maxsize=256)
+def _compile_projection(paths: tuple[tuple[str, ...], ...], wrap: bool) -> Callable[[object], tuple]:
+    """트라이를 따라 내려가는 직선 코드를 생성한다. 공통 접두사는 한 번만 조회한다.
+
+    중첩 if 대신 노드마다 '부모가 없으면 없음' 가드를 둔 평평한 대입문을 만들어
+    경로 깊이와 무관하게 컴파일된다 (들여쓰기 한도 없음).
+    중간 값이 dict가 아니어서 AttributeError가 나면 경로별 getter로 다시 계산한다.
+    """
+    keys: List[str] = []
+    lines: List[str] = []
+    counter = count()
+    indent = "            "
+    stack: List[tuple[_TrieNode, str]] = [(_build_trie(paths), "d")]
+    while stack:
+        node, var = stack.pop()
+        for i in node.outputs:
+            lines.append(f"{indent}r{i} = {var}")
+        for key, child in node.children.items():
+            keys.append(key)
+            k = f"k{len(keys) - 1}"
+            v = f"n{next(counter)}"
+            if var == "d":
+                lines.append(f"{indent}{v} = d.get({k}, _MISSING)")
+            else:
+                lines.append(f"{indent}{v} = {var}.get({k}, _MISSING) if {var} is not _MISSING else _MISSING")
+            lines.append(f"{indent}if {v} is None: {v} = _MISSING")
+            stack.append((child, v))
+    n = len(paths)
+    results = [f"r{i}" for i in range(n)]
+    if wrap:
+        results = [f"_NOTHING if r{i} is _MISSING else _Just(r{i})" for i in range(n)]
+    src = "\n".join([
+        f"def _make(_slow, {', '.join(f'k{j}' for j in range(len(keys)))}):",
+        "    def row(d):",
+        "        try:",
+        "            pass",
+        *(f"            r{i} = _MISSING" for i in range(n)),
+        *lines,
+        "        except AttributeError:",
+        "            return _slow(d)",
+        f"        return ({''.join(r + ', ' for r in results)})",
+        "    return row",
+    ])
+    namespace: dict[str, object] = {"_MISSING": _MISSING, "_NOTHING": Nothing(), "_Just": Just}
+    exec(compile(src, f"<projection of {n} paths>", "exec"), namespace)
+    getters = tuple(_compile_maybe(p) if wrap else _compile_raw(p) for p in paths)
+    slow = lambda d: tuple(g(d) for g in getters)
+    return namespace["_make"](slow, *keys)  # type: ignore[operator]
+
+class Projection:
+    """여러 경로를 한 번의 순회로 꺼내는 프로젝터. project(paths)로 만든다.
+
+    - proj(record) -> 경로 순서대로 Maybe 튜플 (safe_get_in 과 같은 규칙)
+    - proj.columns(records) -> 필드별 열(column) 리스트
+    """
+    __slots__ = ("paths", "_row", "_raw")
+
+    def __init__(self, paths: tuple[tuple[str, ...], ...]):
+        self.paths = paths
+        self._row = _compile_projection(paths, True)
+        self._raw = _compile_projection(paths, False)
+
+    def __call__(self, record: dict) -> tuple[Maybe[object], ...]:
+        return self._row(record)
+
+    def columns(
+        self,
+        records: Iterable[dict],
+        *,
+        dense: bool = False,
+        default: object = None,
+    ) -> List[List[Maybe[object]]] | List[tuple[List[object], List[bool]]]:
+        """필드별 열을 돌려준다. 형식은 get_in_many 와 같다.
+
+        - dense=False: 필드마다 List[Maybe]
+        - dense=True : 필드마다 (values, mask)
+        """
+        if not dense:
+            cols = list(zip(*map(self._row, records)))
+            return [list(c) for c in cols] if cols else [[] for _ in self.paths]
+        cols = list(zip(*map(self._raw, records)))
+        if not cols:
+            return [([], []) for _ in self.paths]
+        return [
+            ([default if v is _MISSING else v for v in c], [v is not _MISSING for v in c])
+            for c in cols
+        ]
+
+    def __repr__(self) -> str:
+        return f"Projection({['.'.join(p) for p in self.paths]!r})"
+
+@lru_cache(maxsize=256)
+def _project(paths: tuple[tuple[str, ...], ...]) -> Projection:
+    return Projection(paths)
+
+def project(paths: Iterable[Sequence[str] | str]) -> Projection:
+    """경로 집합으로 Projection 을 만든다 (같은 경로 집합은 캐시 재사용).
+
+    예)
+      p = project(["user.name", "user.address.city", "user.address.zip"])
+      p(doc) -> (Just('kim'), Just('Seoul'), Nothing())
+    """
+    return _project(tuple(_normalize_path(p) for p in paths))
+
+
 
 
 # -----------------------------
@@ -108,8 +365,16 @@ def to_int_or_none(s: str) -> Maybe[int]:
     except Exception:
         return Nothing()
 
+class _KeepIf:
+    """keep_if 가 돌려주는 호출 객체. Just.flatmap 이 알아보고 할당 없이 처리한다."""
+    __slots__ = ("pred",)
+    def __init__(self, pred: Callable[[T], bool]):
+        self.pred = pred
+    def __call__(self, x: T) -> Maybe[T]:
+        return Just(x) if self.pred(x) else Nothing()
+
 def keep_if(pred: Callable):
-    return lambda x: Just(x) if pred(x) else Nothing()
+    return _KeepIf(pred)
 
 def process_numbers_pipeline(strings: Iterable[str]) -> List[int]:
     """문자열 리스트에서 정수 파싱 → 짝수 필터 → 제곱 → 100 이상만.
@@ -121,12 +386,68 @@ def process_numbers_pipeline(strings: Iterable[str]) -> List[int]:
     예)
       ['10','-','20','x','7'] -> [100, 400]
     """
+    # 스테이지 함수는 원소마다 새로 만들지 않도록 한 번만 생성한다.
+    is_even = keep_if(lambda n: (n & 1) == 0)
+    square = lambda n: n * n
+    at_least_100 = keep_if(lambda n: n >= 100)
     stream = (
         to_int_or_none(s)                             # Maybe[int]
-          .flatmap(keep_if(lambda n: (n & 1) == 0))   # 짝수만
-          .map(lambda n: n * n)                       # 제곱
-          .flatmap(keep_if(lambda n: n >= 100))       # 100 이상만
+          .flatmap(is_even)                           # 짝수만
+          .map(square)                                # 제곱
+          .flatmap(at_least_100)                      # 100 이상만
           .get_or(None)                               # Optional[int]
         for s in strings
     )
-    return [v for v in stream if v is not None]
\ No newline at end of file
+    return [v for v in stream if v is not None]
+
+
+# -----------------------------
+# process_numbers_pipeline 일괄(batch) 버전
+# -----------------------------
+_BATCH_BLOCK = 8192
+_SQUARE_SAFE = 3_037_000_499  # int64 에서 제곱해도 넘치지 않는 최대 절댓값
+
+def _parse_ints(strings: Iterable[Any]) -> List[int]:
+    # to_int_or_none 과 같은 규칙: int()가 실패하면(어떤 예외든) 버린다.
+    out: List[int] = []
+    append = out.append
+    for s in strings:
+        try:
+            append(int(s))
+        except Exception:
+            pass
+    return out
+
+def _even_squares_at_least_100(ints: Iterable[int]) -> List[int]:
+    # 짝수 n 에 대해 n*n >= 100 은 |n| >= 10 과 같다.
+    return [n * n for n in ints if not n & 1 and (n >= 10 or n <= -10)]
+
+def _process_numbers_ndarray(arr: Any) -> List[int]:
+    out: List[int] = []
+    for start in range(0, len(arr), _BATCH_BLOCK):
+        block = arr[start:start + _BATCH_BLOCK]
+        try:
+            ns = block.astype(np.int64)
+        except (ValueError, OverflowError):
+            # 파싱 불가/범위 초과 값이 섞인 블록만 파이썬 경로로 처리
+            out.extend(_even_squares_at_least_100(_parse_ints(block.tolist())))
+            continue
+        kept = ns[((ns & 1) == 0) & ((ns >= 10) | (ns <= -10))]
+        if ((kept > _SQUARE_SAFE) | (kept < -_SQUARE_SAFE)).any():
+            out.extend(n * n for n in kept.tolist())
+        else:
+            out.extend((kept * kept).tolist())
+    return out
+
+def process_numbers_batch(strings: Iterable[str] | Any) -> List[int]:
+    """process_numbers_pipeline 과 같은 결과를 Maybe 래퍼 없이 일괄 계산한다.
+
+    - 파싱/짝수/제곱/100 이상 단계를 한꺼번에 처리 (원소당 Maybe 할당 없음).
+    - 파싱 불가 값은 to_int_or_none 과 같이 조용히 버린다 (int()가 실패하는 모든 값).
+    - NumPy 문자열/바이트 배열(dtype 'U'/'S')은 블록 단위로 벡터화하고,
+      파싱 불가 값이나 int64 범위를 넘는 값이 있는 블록만 파이썬 경로로 처리.
+    - 그 외 이터러블은 파이썬 일괄 경로.
+    """
+    if np is not None and isinstance(strings, np.ndarray) and strings.dtype.kind in "US":
+        return _process_numbers_ndarray(strings.ravel())
+    return _even_squares_at_least_100(_parse_ints(strings))
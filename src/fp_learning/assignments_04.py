@@ -1,16 +1,51 @@
 # path: assignments_04.py
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Iterator
+import math
+import queue
+import threading
+import time
+import weakref
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from itertools import islice
 from typing import Any, TypeVar
 
+from fp_learning._feed import DONE, Raised, read_into, stop_reader
+from fp_learning.assignments_02 import drop, take
+from fp_learning.memo import memoize
+from fp_learning.parallel import parallel_map
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
 A = TypeVar("A")
 B = TypeVar("B")
 C = TypeVar("C")
 T = TypeVar("T")
 U = TypeVar("U")
 
-__all__ = ["compose2", "pipe_iter", "discounted_total_for_books"]
+__all__ = [
+    "compose2",
+    "compose",
+    "pipe",
+    "identity",
+    "compose_memo",
+    "pipe_iter",
+    "PipelineProfile",
+    "StageStats",
+    "discounted_total_for_books",
+    "discounted_total_engine",
+    "Stage",
+    "map_stage",
+    "filter_stage",
+    "take_stage",
+    "drop_stage",
+    "prefetch",
+]
 
 
 def compose2(f: Callable[[B], C], g: Callable[[A], B]) -> Callable[[A], C]:
@@ -28,9 +63,89 @@ def compose2(f: Callable[[B], C], g: Callable[[A], B]) -> Callable[[A], C]:
     return lambda x: f(g(x))
 
 
+def identity(x: T) -> T:
+    """항등 함수. compose/pipe 는 이 함수를 단계에서 제거한다."""
+    return x
+
+
+@lru_cache(maxsize=256)
+def _chain_factory(n: int) -> Callable[..., Callable[[Any], Any]]:
+    """단계 수마다 한 번만 '순서대로 호출하는' 함수 본문을 생성/컴파일한다.
+
+    중첩 람다 대신 한 프레임 안에서 x = f0(x); x = f1(x); ... 를 수행한다.
+    """
+    params = ", ".join(f"f{i}" for i in range(n))
+    body = "\n".join(f"        x = f{i}(x)" for i in range(n))
+    src = f"def _make({params}):\n    def composed(x):\n{body}\n        return x\n    return composed"
+    namespace: dict[str, Any] = {}
+    exec(compile(src, f"<chain of {n}>", "exec"), namespace)
+    return namespace["_make"]
+
+
+# compose/pipe 가 생성한 함수 -> 그 단계들. 속성으로 달면 functools.wraps/memoize 같은
+# 래퍼가 __dict__ 와 함께 복사해 가서 래퍼까지 펼쳐지므로, 함수 '객체' 기준으로 기록한다.
+_COMPOSED_STAGES: weakref.WeakKeyDictionary[Callable[[Any], Any], tuple[Callable[[Any], Any], ...]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _chain(stages: tuple[Callable[[Any], Any], ...]) -> Callable[[Any], Any]:
+    # stages 는 '호출 순서'. 이미 합성된 함수는 펼치고, identity 는 뺀다.
+    flat: list[Callable[[Any], Any]] = []
+    for f in stages:
+        try:
+            inner = _COMPOSED_STAGES.get(f)
+        except TypeError:  # 약한 참조를 만들 수 없는 호출 가능 객체
+            inner = None
+        if inner is not None:
+            flat.extend(inner)
+        elif f is not identity:
+            flat.append(f)
+    if not flat:
+        return identity
+    if len(flat) == 1:
+        return flat[0]
+    composed = _chain_factory(len(flat))(*flat)
+    _COMPOSED_STAGES[composed] = tuple(flat)
+    return composed
+
+
+def compose(*fs: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """
+    N항 합성: compose(f, g, h)(x) == f(g(h(x)))  (compose2 의 일반화)
+
+    - compose/pipe 로 만든 함수를 다시 합성하면 단계를 펼쳐서 한 층으로 만든다.
+    - identity 단계는 제거한다. 인자가 없으면 identity.
+    - 결과는 단계들을 차례로 호출하는 하나의 생성 함수라 중첩 람다/추가 호출이 없다.
+    """
+    return _chain(fs[::-1])
+
+
+def pipe(*fs: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """
+    왼쪽→오른쪽 합성: pipe(f, g, h)(x) == h(g(f(x)))  (compose 와 방향만 반대)
+    """
+    return _chain(fs)
+
+
+def compose_memo(*fs: Callable[[Any], Any], **options: Any) -> Callable[[Any], Any]:
+    """
+    compose_memo(f, g, h)(x) == f(g(h(x))) 이되, 합성된 '전체' 함수를 한 번에 캐시한다.
+
+    - 단계별 캐시가 아니므로 적중 시 어떤 단계도 호출되지 않는다.
+    - options 는 memoize 의 옵션(maxsize, ttl, max_bytes, thread_safe ...).
+    - 모든 단계가 순수 함수여야 한다.
+    """
+    if not fs:
+        raise TypeError("compose_memo needs at least one function")
+    return memoize(compose(*fs), **options)
+
+
 def pipe_iter(
     data: Iterable[T],
     *stages: Callable[[Iterable[Any]], Iterable[Any]],
+    fuse: bool = False,
+    profile: PipelineProfile | None = None,
 ) -> Iterator[Any]:
     """
     이터러블 파이프라인(레이지 유지):
@@ -43,12 +158,301 @@ def pipe_iter(
 
     힌트
     - 내부에서 현재 이터러블을 누적 갱신하며 마지막에 `yield from`으로 방출.
+
+    fuse=True 면 연속된 선언형 스테이지(map_stage/filter_stage/take_stage/drop_stage)를
+    하나의 생성 루프로 합쳐 원소당 제너레이터 프레임 수를 줄인다. 결과와 지연성은 동일.
+
+    profile=PipelineProfile(...) 을 넘기면 각 스테이지를 계측 래퍼로 감싸 StageStats 를
+    채운다 (퓨전 후의 스테이지 단위). None(기본)이면 래퍼를 전혀 만들지 않는다.
     """
+    if fuse:
+        stages = _fuse_stages(stages)
+    if profile is not None:
+        yield from _profiled_pipeline(data, stages, profile)
+        return
     for stage in stages:
         data = stage(data)
     yield from data 
 
 
+# -----------------------------
+# 스테이지 단위 프로파일링
+# -----------------------------
+@dataclass(slots=True)
+class StageStats:
+    """pipe_iter 스테이지 하나의 계측 결과.
+
+    - items_in / items_out: 상류에서 당긴 / 하류로 내보낸 원소 수
+    - wall / cpu: 스테이지 자체에 쓴 시간(초). 상류를 기다린 시간은 빠진 값.
+      cpu 는 소비자 스레드 기준(time.thread_time)이라 백그라운드 스레드 작업은 포함되지 않음.
+    - wait: 상류 next() 에서 막혀 있던 시간(초)
+    - peak_buffered: 원소 하나를 내보내기까지 상류에서 당긴 최대 원소 수
+      (batched(k) 면 k, map 이면 1, 미리 읽기 스테이지면 그 깊이)
+    - finished: 끝까지 소비됐는지(False 면 중간 종료/예외)
+    """
+    index: int
+    name: str
+    items_in: int = 0
+    items_out: int = 0
+    wall: float = 0.0
+    cpu: float = 0.0
+    wait: float = 0.0
+    wait_cpu: float = 0.0
+    peak_buffered: int = 0
+    finished: bool = False
+
+
+class PipelineProfile:
+    """pipe_iter(..., profile=...) 로 넘기는 계측 수집기.
+
+    - stages: 스테이지 순서대로의 StageStats 리스트 (실행 중에도 읽을 수 있음)
+    - on_stage: 파이프라인이 끝날 때(소진/close/예외) 스테이지마다 한 번씩 호출되는 콜백
+    - report(): 직렬화하기 쉬운 dict 리스트, format(): 사람이 읽는 표
+    - 같은 프로파일로 여러 번 실행하면 stages 가 이어서 쌓인다.
+    """
+
+    def __init__(self, on_stage: Callable[[StageStats], None] | None = None):
+        self.stages: list[StageStats] = []
+        self.on_stage = on_stage
+
+    def report(self) -> list[dict[str, Any]]:
+        return [asdict(st) for st in self.stages]
+
+    def format(self) -> str:
+        lines = [f"{'#':>2} {'stage':<24} {'in':>9} {'out':>9} {'wall s':>9} {'cpu s':>9} {'wait s':>9} {'peak':>6}"]
+        for st in self.stages:
+            lines.append(
+                f"{st.index:>2} {st.name[:24]:<24} {st.items_in:>9} {st.items_out:>9} "
+                f"{st.wall:>9.4f} {st.cpu:>9.4f} {st.wait:>9.4f} {st.peak_buffered:>6}"
+            )
+        return "\n".join(lines)
+
+
+def _stage_name(stage: Callable[..., Any]) -> str:
+    if isinstance(stage, Stage):
+        return f"{stage.kind}({getattr(stage.arg, '__name__', stage.arg)!s})"
+    return getattr(stage, "__name__", None) or type(stage).__name__
+
+
+def _probe(src: Iterable[T], st: StageStats) -> Iterator[T]:
+    """스테이지 입력 쪽 래퍼: 상류 next() 에 걸린 시간과 당긴 개수를 센다."""
+    it = iter(src)
+    clock, cpu = time.perf_counter, time.thread_time
+    while True:
+        t0, c0 = clock(), cpu()
+        try:
+            x = next(it)
+        except StopIteration:
+            return
+        finally:
+            st.wait += clock() - t0
+            st.wait_cpu += cpu() - c0
+        st.items_in += 1
+        yield x
+
+
+def _timed(out: Iterable[T], st: StageStats) -> Iterator[T]:
+    """스테이지 출력 쪽 래퍼: next() 당 포함 시간에서 상류 대기 시간을 빼 자기 시간을 쌓는다."""
+    it = iter(out)
+    clock, cpu = time.perf_counter, time.thread_time
+    while True:
+        t0, c0, w0, wc0, n0 = clock(), cpu(), st.wait, st.wait_cpu, st.items_in
+        try:
+            x = next(it)
+        except StopIteration:
+            st.finished = True
+            return
+        finally:
+            # prefetch 처럼 상류를 다른 스레드에서 당기는 스테이지는 대기 시간이 겹치므로 0 아래로 내리지 않는다.
+            st.wall += max(0.0, clock() - t0 - (st.wait - w0))
+            st.cpu += max(0.0, cpu() - c0 - (st.wait_cpu - wc0))
+            st.peak_buffered = max(st.peak_buffered, st.items_in - n0)
+        st.items_out += 1
+        yield x
+
+
+def _profiled_pipeline(
+    data: Iterable[Any],
+    stages: tuple[Callable[[Iterable[Any]], Iterable[Any]], ...],
+    profile: PipelineProfile,
+) -> Iterator[Any]:
+    base = len(profile.stages)
+    stats = [StageStats(base + i, _stage_name(s)) for i, s in enumerate(stages)]
+    profile.stages.extend(stats)
+    clock, cpu = time.perf_counter, time.thread_time
+    try:
+        for stage, st in zip(stages, stats):
+            # sorted 처럼 생성 시점에 입력을 읽는 스테이지도 있으므로 생성 자체도 계측한다.
+            t0, c0 = clock(), cpu()
+            out = stage(_probe(data, st))
+            st.wall += clock() - t0 - st.wait
+            st.cpu += cpu() - c0 - st.wait_cpu
+            data = _timed(out, st)
+        yield from data
+    finally:
+        if profile.on_stage is not None:
+            for st in stats:
+                profile.on_stage(st)
+
+
+# -----------------------------
+# 선언형 스테이지 + 퓨전
+# -----------------------------
+_STAGE_KINDS = frozenset({"map", "filter", "take", "drop"})
+
+
+@dataclass(frozen=True, slots=True)
+class Stage:
+    """pipe_iter 용 선언형 스테이지. 그대로 호출하면 일반 스테이지로 동작한다.
+
+    kind: "map" | "filter" | "take" | "drop"
+    arg : map/filter 는 함수, take/drop 은 개수
+    """
+    kind: str
+    arg: Any
+
+    def __post_init__(self) -> None:
+        if self.kind not in _STAGE_KINDS:
+            raise ValueError(f"unknown stage kind: {self.kind!r}")
+
+    def __call__(self, data: Iterable[Any]) -> Iterator[Any]:
+        if self.kind == "map":
+            return map(self.arg, data)
+        if self.kind == "filter":
+            return filter(self.arg, data)
+        if self.kind == "take":
+            return take(self.arg, data)
+        return drop(self.arg, data)
+
+def map_stage(f: Callable[[Any], Any]) -> Stage:
+    return Stage("map", f)
+
+def filter_stage(pred: Callable[[Any], bool]) -> Stage:
+    return Stage("filter", pred)
+
+def take_stage(n: int) -> Stage:
+    return Stage("take", n)
+
+def drop_stage(n: int) -> Stage:
+    return Stage("drop", n)
+
+
+@lru_cache(maxsize=256)
+def _compile_fused(kinds: tuple[str, ...]) -> Callable[..., Callable[[Iterable[Any]], Iterator[Any]]]:
+    """스테이지 종류 조합마다 한 번만 소스를 생성/컴파일해 팩토리를 캐시한다.
+
+    생성되는 함수는 입력에서 원소를 하나 꺼내 모든 스테이지를 순서대로 적용한다.
+    take 가 한도에 도달하면 다음 원소를 꺼내기 전에 종료하므로 체인 방식과
+    정확히 같은 개수만 소비한다.
+    """
+    prologue: list[str] = []
+    body: list[str] = []
+    stops: list[str] = []
+
+    def leave(indent: str) -> list[str]:
+        # 원소 처리를 끝내고 다음 원소로 넘어가기 전, take 한도 도달 여부 확인
+        return [f"{indent}if {' or '.join(stops)}: return"] if stops else []
+
+    for i, kind in enumerate(kinds):
+        a = f"a{i}"
+        if kind == "map":
+            body.append(f"x = {a}(x)")
+        elif kind == "filter":
+            body += [f"if not {a}(x):", *leave("    "), "    continue"]
+        elif kind == "drop":
+            prologue.append(f"c{i} = 0")
+            body += [f"if c{i} < {a}:", f"    c{i} += 1", *leave("    "), "    continue"]
+        elif kind == "take":
+            prologue += [f"if {a} <= 0: return", f"c{i} = 0"]
+            body.append(f"c{i} += 1")
+            stops.append(f"c{i} >= {a}")
+        else:
+            raise ValueError(f"unknown stage kind: {kind!r}")
+    body += ["yield x", *leave("")]
+
+    params = ", ".join(f"a{i}" for i in range(len(kinds)))
+    src = "\n".join([
+        f"def _make({params}):",
+        "    def _fused(data):",
+        *(f"        {line}" for line in prologue),
+        "        for x in data:",
+        *(f"            {line}" for line in body),
+        "    return _fused",
+    ])
+    namespace: dict[str, Any] = {}
+    exec(compile(src, f"<fused {'/'.join(kinds)}>", "exec"), namespace)
+    return namespace["_make"]
+
+def _fuse_stages(
+    stages: tuple[Callable[[Iterable[Any]], Iterable[Any]], ...],
+) -> tuple[Callable[[Iterable[Any]], Iterable[Any]], ...]:
+    """연속된 Stage 묶음을 하나의 퓨전 스테이지로 치환한다 (일반 스테이지는 그대로)."""
+    out: list[Callable[[Iterable[Any]], Iterable[Any]]] = []
+    run: list[Stage] = []
+
+    def flush() -> None:
+        if run:
+            kinds = tuple(s.kind for s in run)
+            fused = _compile_fused(kinds)(*(s.arg for s in run))
+            fused.__name__ = f"fused({','.join(kinds)})"
+            out.append(fused)
+            run.clear()
+
+    for stage in stages:
+        if isinstance(stage, Stage):
+            run.append(stage)
+        else:
+            flush()
+            out.append(stage)
+    flush()
+    return tuple(out)
+
+
+# -----------------------------
+# 미리 읽기(prefetch) 스테이지
+# -----------------------------
+def _prefetch(data: Iterable[T], n: int) -> Iterator[T]:
+    q: queue.Queue[Any] = queue.Queue(maxsize=n)
+    stop = threading.Event()
+    reader = threading.Thread(target=read_into, args=(iter(data), q, stop), name="prefetch", daemon=True)
+    reader.start()
+    try:
+        while True:
+            item = q.get()
+            if item is DONE:
+                return
+            if isinstance(item, Raised):
+                raise item.exc
+            yield item
+    finally:
+        stop_reader(reader, q, stop)
+
+
+def prefetch(n: int) -> Callable[[Iterable[T]], Iterator[T]]:
+    """
+    상류를 백그라운드 스레드에서 최대 n개까지 미리 읽는 pipe_iter 스테이지를 만든다.
+
+    예)
+        pipe_iter(read_lines(path), prefetch(64), map_stage(parse), take_stage(10))
+
+    요구사항
+    - I/O 대기형 상류와 CPU 연산형 하류가 겹쳐 실행되도록 한다. 순서는 유지.
+    - 큐 크기 n 으로 제한 (상류는 소비자보다 최대 n개 + 읽는 중 1개만 앞섬). n <= 0 이면 ValueError.
+    - 첫 next() 에서 스레드를 시작 (지연). 상류 예외는 소비자 쪽에서 그대로 다시 발생.
+    - 소비자가 멈추면(close/GeneratorExit, 예: take 이후) 다음 순서로 정리:
+        1) 읽기 스레드에 중단 신호  2) 스레드가 상류를 close()  3) 스레드 join 후 반환
+      상류가 next() 안에서 막혀 있으면 그 원소를 받을 때까지 기다린다.
+    """
+    if n <= 0:
+        raise ValueError("n must be positive")
+
+    def stage(data: Iterable[T]) -> Iterator[T]:
+        return _prefetch(data, n)
+
+    stage.__name__ = f"prefetch({n})"
+    return stage
+
+
 def discounted_total_for_books(items: Iterable[dict[str, Any]]) -> float:
     """
     미니 프로젝트:
@@ -77,4 +481,82 @@ def discounted_total_for_books(items: Iterable[dict[str, Any]]) -> float:
     total = get_total(qty_over_2s)
     discounted_total = apply_discount(total)
     rounded_total = round_to_2(discounted_total)
-    return rounded_total
\ No newline at end of file
+    return rounded_total
+
+# -----------------------------
+# 집계 엔진: 단일 패스 / 보정 합산 / 파티션 병렬 / 컬럼형 입력
+# -----------------------------
+_BOOK_FIELDS = ("price", "qty", "category")
+
+
+def _book_terms(items: Iterable[dict[str, Any]]) -> Iterator[float]:
+    # 두 번의 filter + 합을 한 번의 순회로 합친다. 조건 평가 순서는 원본과 같다.
+    return (
+        item.get("price") * qty
+        for item in items
+        if item.get("category") == "book" and (qty := item.get("qty")) >= 2
+    )
+
+
+def _partition_total(items: tuple[dict[str, Any], ...]) -> float:
+    """워커 프로세스에서 실행: 파티션 하나의 부분합(보정 합산)."""
+    return math.fsum(_book_terms(items))
+
+
+def _is_columnar(data: Any) -> bool:
+    if np is not None and isinstance(data, np.ndarray):
+        names = data.dtype.names or ()
+        return all(f in names for f in _BOOK_FIELDS)
+    return isinstance(data, Mapping) and all(f in data for f in _BOOK_FIELDS)
+
+
+def _columnar_terms(data: Any) -> Iterable[float]:
+    price, qty, category = (data[f] for f in _BOOK_FIELDS)
+    if np is not None:
+        price, qty, category = np.asarray(price), np.asarray(qty), np.asarray(category)
+        mask = (category == "book") & (qty >= 2)
+        # 곱셈은 행 단위와 같은 float64 연산이므로 항 하나하나가 원본과 비트 단위로 같다.
+        return (price[mask] * qty[mask]).tolist()
+    return (p * q for p, q, c in zip(price, qty, category) if c == "book" and q >= 2)
+
+
+def discounted_total_engine(
+    data: Iterable[dict[str, Any]] | Mapping[str, Any] | Any,
+    *,
+    exact: bool = True,
+    workers: int = 1,
+    partition_size: int = 100_000,
+) -> float:
+    """
+    discounted_total_for_books 의 대용량 집계 버전.
+
+    요구사항
+    - data:
+        * 주문 행(dict) 이터러블 -> 한 번의 순회로 필터/곱/합을 처리 (스트림, 무제한 길이 가능)
+        * 컬럼형: {'price': seq, 'qty': seq, 'category': seq} 또는 같은 필드를 가진
+          NumPy 구조화 배열 -> numpy 가 있으면 마스크 연산으로 벡터화
+    - exact=True (기본): math.fsum 보정 합산. 항 순서와 무관하게 올바르게 반올림된 합.
+      exact=False: 원본과 같은 왼쪽->오른쪽 float 누적 (단일 프로세스에서 원본과 비트 단위 동일).
+    - 할인(* 0.9)과 round(..., 2)는 원본과 같은 float 연산. 따라서 합산 오차가 0.005 경계를
+      넘지 않는 한(= 사실상 모든 실제 금액 데이터) 원본과 같은 반올림 결과를 낸다.
+    - workers > 1: 행 스트림을 partition_size 개씩 잘라 프로세스 풀에서 부분합을 구하고
+      fsum 으로 합친다 (parallel_map 의 백프레셔 그대로). 이 경우 exact=True 만 허용.
+      컬럼형 입력은 이미 벡터화되어 있으므로 workers 를 무시한다.
+    - 입력은 변경하지 않음.
+    """
+    if workers <= 0:
+        raise ValueError("workers must be positive")
+    if partition_size <= 0:
+        raise ValueError("partition_size must be positive")
+    if _is_columnar(data):
+        terms: Iterable[float] = _columnar_terms(data)
+    elif workers > 1:
+        if not exact:
+            raise ValueError("exact=False is only supported with workers=1")
+        it = iter(data)
+        partitions = iter(lambda: tuple(islice(it, partition_size)), ())
+        terms = parallel_map(_partition_total, partitions, workers=workers, chunksize=1, ordered=False)
+    else:
+        terms = _book_terms(data)
+    total = math.fsum(terms) if exact else sum(terms)
+    return round(total * 0.9, 2)
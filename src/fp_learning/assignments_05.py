@@ -1,9 +1,14 @@
 # path: fp_learning/assignments_05.py
 from __future__ import annotations
 
+import asyncio
+import multiprocessing
+import os
+from array import array
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from functools import reduce
-from typing import Callable, Generic, Iterable, TypeVar, Union
+from typing import Any, Awaitable, Callable, Generic, Iterable, Iterator, TypeVar, Union
 
 T = TypeVar("T")
 U = TypeVar("U")
@@ -11,6 +16,17 @@ E = TypeVar("E")
 A = TypeVar("A")
 B = TypeVar("B")
 
+try:  # numpy는 선택 의존성: ResultArray 의 값 열을 ndarray 로 둘 때만 쓴다.
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy 미설치 환경
+    np = None
+
+# 프로세스 풀은 fork 대신 forkserver(없으면 spawn)로 띄운다: result_traverse_threads 가 Err 로
+# 일찍 돌아오면 풀 스레드가 아직 살아 있을 수 있고, 스레드가 있는 프로세스의 fork 는 교착 위험이 있다.
+_MP_CONTEXT = multiprocessing.get_context(
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
 
 # -----------------------------
 # Minimal containers (self-contained for the assignment)
@@ -49,6 +65,40 @@ def is_ok(r: Result[T, E]) -> bool: return isinstance(r, Ok)
 def is_err(r: Result[T, E]) -> bool: return isinstance(r, Err)
 
 
+# -----------------------------
+# 스택 안전(trampolined) Result 바인딩
+# -----------------------------
+# 만든 뒤 바꾸지 말 것 (frozen 을 쓰지 않는 이유는 assignments_03.Bind 참고).
+@dataclass(slots=True, eq=False)
+class ResultBind(Generic[A, B, E]):
+    """`source` 가 Ok면 fn 을 적용하는 바인딩을 '설명'만 하는 값. run_result 가 반복문으로 실행한다."""
+    source: "Result[A, E] | ResultBind[object, A, E]"
+    fn: "Callable[[A], Result[B, E] | ResultBind[object, B, E]]"
+
+def result_bind(
+    r: "Result[A, E] | ResultBind[object, A, E]",
+    f: "Callable[[A], Result[B, E] | ResultBind[object, B, E]]",
+) -> ResultBind[A, B, E]:
+    return ResultBind(r, f)
+
+def run_result(prog: "Result[T, E] | ResultBind[object, T, E]") -> Result[T, E]:
+    """ResultBind 로 만든 프로그램을 상수 스택으로 실행한다.
+
+    - 첫 Err 에서 남은 단계를 모두 건너뛰고 그 Err 를 반환.
+    - 단계 함수의 예외는 그대로 전파 (result_apply 와 같은 규칙).
+    """
+    pending: list[Callable[[object], object]] = []
+    cur: object = prog
+    while True:
+        if type(cur) is ResultBind:
+            pending.append(cur.fn)
+            cur = cur.source
+            continue
+        if not pending or not isinstance(cur, Ok):
+            return cur  # type: ignore[return-value]
+        cur = pending.pop()(cur.value)
+
+
 # -----------------------------
 # Assignment 1: Result.apply (Applicative 스타일)
 # -----------------------------
@@ -127,4 +177,419 @@ def result_traverse(xs: Iterable[A], f: Callable[[A], Result[B, E]]) -> Result[l
         r = f(x)
         if is_err(r):
             return r
-        acc.append(r.value)
\ No newline at end of file
+        acc.append(r.value)
+
+
+# -----------------------------
+# 스트리밍 result_sequence (리스트를 만들지 않음)
+# -----------------------------
+def result_sequence_into(
+    xs: Iterable[Result[T, E]],
+    sink: Callable[[T], object],
+    *,
+    on_commit: Callable[[int], object] | None = None,
+    on_rollback: Callable[[Err[E] | BaseException], object] | None = None,
+) -> Result[int, E]:
+    """result_sequence 의 스트리밍 버전: Ok 값을 도착하는 대로 sink(value) 로 넘긴다.
+
+    요구사항
+    - 왼쪽→오른쪽으로 진행하다 첫 Err 에서 멈추고 그 Err 를 반환 (result_sequence 와 같음).
+    - 모두 Ok 면 Ok(넘긴 개수) 반환. List[T] 는 만들지 않는다.
+    - 부분 결과를 보면 안 되는 싱크를 위한 훅:
+      on_commit(count)  : 끝까지 Ok 였을 때 한 번 호출
+      on_rollback(reason): 첫 Err(그 Err) 또는 예외(그 예외)로 중단될 때 한 번 호출, 예외는 다시 던짐
+    - 각 훅은 최대 한 번만 호출된다.
+      on_commit 이 예외를 내면 커밋 실패로 보고 on_rollback(그 예외) 후 다시 던진다.
+      on_rollback 자체가 예외를 내면 그 예외가 전파된다 (롤백을 다시 부르지 않음).
+    예)
+      staged = open(tmp, "w")
+      result_sequence_into(rows, lambda v: staged.write(v),
+                           on_commit=lambda n: os.replace(tmp, final),
+                           on_rollback=lambda why: os.remove(tmp))
+    """
+    count = 0
+    failed: Err[E] | None = None
+    try:
+        for r in xs:
+            if is_err(r):
+                failed = r
+                break
+            sink(r.value)
+            count += 1
+        else:
+            if on_commit is not None:
+                on_commit(count)
+    except BaseException as e:
+        if on_rollback is not None:
+            on_rollback(e)
+        raise
+    # Err 경로의 롤백은 try 밖에서: 훅이 실패해도 다시 롤백하지 않고 그 예외가 그대로 나간다.
+    if failed is not None:
+        if on_rollback is not None:
+            on_rollback(failed)
+        return failed
+    return ok(count)
+
+def result_traverse_into(
+    xs: Iterable[A],
+    f: Callable[[A], Result[B, E]],
+    sink: Callable[[B], object],
+    **hooks: Any,
+) -> Result[int, E]:
+    """result_traverse 의 스트리밍 버전. 훅은 result_sequence_into 와 같다."""
+    return result_sequence_into(map(f, xs), sink, **hooks)
+
+
+# -----------------------------
+# 에러 누적 검증 (메모리 상한)
+# -----------------------------
+@dataclass(frozen=True, slots=True)
+class ErrorReport(Generic[E]):
+    """result_validate 의 Err 내용: 앞에서부터 최대 max_errors 개의 (index, error)와 전체 개수."""
+    errors: tuple[tuple[int, E], ...]
+    total: int
+
+    @property
+    def omitted(self) -> int:
+        """상한 때문에 보관하지 못한 에러 개수."""
+        return self.total - len(self.errors)
+
+def result_validate(
+    xs: Iterable[A],
+    f: Callable[[A], Result[B, E]],
+    max_errors: int = 100,
+) -> Result[list[B], ErrorReport[E]]:
+    """result_traverse 와 달리 첫 Err 에서 멈추지 않고 모든 원소를 검사한다.
+
+    요구사항
+    - 모두 Ok 면 Ok(List[B]) (result_traverse 와 같음).
+    - 하나라도 Err 면 Err(ErrorReport): 앞에서부터 max_errors 개의 (index, error)만
+      보관하고 나머지는 개수만 센다.
+    - 첫 Err 이후에는 Ok 값을 더 모으지 않고 이미 모은 것도 버린다 (결과가 Err 이므로).
+    """
+    if max_errors < 0:
+        raise ValueError("max_errors must be non-negative")
+    acc: list[B] | None = []
+    errors: list[tuple[int, E]] = []
+    total = 0
+    for i, r in enumerate(map(f, xs)):
+        if is_err(r):
+            total += 1
+            acc = None
+            if len(errors) < max_errors:
+                errors.append((i, r.error))
+        elif acc is not None:
+            acc.append(r.value)
+    if total:
+        return err(ErrorReport(tuple(errors), total))
+    return ok(acc)
+
+def result_validate_stream(
+    xs: Iterable[A],
+    f: Callable[[A], Result[B, E]],
+    ok_sink: Any = None,
+) -> Iterator[tuple[int, Err[E]]]:
+    """검증하면서 Err 를 (index, Err) 로 바로 흘려보낸다 (지연, 상수 메모리).
+
+    - Ok 값은 ok_sink.append(value) 로 넘긴다 (list 또는 append 를 가진 싱크). None 이면 버림.
+    - 무한 입력과도 안전: 소비한 만큼만 검사.
+    예)
+      oks = []
+      for i, e in result_validate_stream(rows, parse, oks):
+          log(i, e.error)
+    """
+    append = ok_sink.append if ok_sink is not None else None
+    for i, r in enumerate(map(f, xs)):
+        if is_err(r):
+            yield i, r
+        elif append is not None:
+            append(r.value)
+
+
+# -----------------------------
+# 동시 실행 result_traverse (스레드 / 프로세스 / asyncio)
+# -----------------------------
+class _TraverseState(Generic[B, E]):
+    """동시 traverse 의 진행 상태: 순서대로 모은 Ok 값과 가장 왼쪽 실패(Err 또는 예외).
+
+    순차 result_traverse 는 왼쪽에서 처음 만난 Err(또는 예외)에서 멈추므로,
+    실패가 여러 개 나와도 인덱스가 가장 작은 것만 의미가 있다.
+    """
+    __slots__ = ("acc", "done", "fail_at", "fail")
+
+    def __init__(self) -> None:
+        self.acc: list[B] = []
+        self.done: dict[int, B] = {}
+        self.fail_at: int | None = None
+        self.fail: Err[E] | BaseException | None = None
+
+    def record(self, i: int, r: Result[B, E] | None, exc: BaseException | None) -> None:
+        if exc is not None or is_err(r):
+            if self.fail_at is None or i < self.fail_at:
+                self.fail_at, self.fail = i, exc if exc is not None else r
+            return
+        self.done[i] = r.value
+        # 앞에서부터 연속으로 끝난 값은 바로 acc 로 옮겨 메모리를 창 크기로 유지한다.
+        while len(self.acc) in self.done:
+            self.acc.append(self.done.pop(len(self.acc)))
+
+    def wanted(self, i: int) -> bool:
+        # 실패 지점보다 오른쪽 작업은 결과에 영향이 없으므로 취소 대상.
+        return self.fail_at is None or i < self.fail_at
+
+    def result(self) -> Result[list[B], E]:
+        if isinstance(self.fail, BaseException):
+            raise self.fail
+        if self.fail is not None:
+            return self.fail
+        return ok(self.acc)
+
+
+def _traverse_in(executor: Executor, xs: Iterable[A], f: Callable[[A], Result[B, E]], limit: int) -> Result[list[B], E]:
+    state: _TraverseState[B, E] = _TraverseState()
+    it = enumerate(xs)
+    pending: dict[Future[Result[B, E]], int] = {}
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and state.fail_at is None and len(pending) < limit:
+                nxt = next(it, None)
+                if nxt is None:
+                    exhausted = True
+                    break
+                pending[executor.submit(f, nxt[1])] = nxt[0]
+            if not any(state.wanted(i) for i in pending.values()):
+                return state.result()
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                i = pending.pop(fut)
+                exc = fut.exception()
+                state.record(i, None if exc is not None else fut.result(), exc)
+            for fut, i in list(pending.items()):
+                if not state.wanted(i) and fut.cancel():
+                    del pending[fut]
+    finally:
+        for fut in pending:
+            fut.cancel()
+
+
+def result_traverse_threads(
+    xs: Iterable[A],
+    f: Callable[[A], Result[B, E]],
+    max_workers: int = 8,
+) -> Result[list[B], E]:
+    """result_traverse 와 같은 결과를 스레드 풀에서 동시 실행으로 계산한다 (I/O 대기형 f).
+
+    요구사항
+    - 동시에 실행/대기하는 f 호출은 max_workers 개 이하, 입력은 필요한 만큼만 읽음.
+    - 결과 리스트는 입력 순서 유지.
+    - 처음 Err 가 나오면 그보다 오른쪽의 대기 작업을 취소하고 더 제출하지 않음.
+      왼쪽 작업은 끝까지 기다려, 순차 버전처럼 '가장 왼쪽' Err(또는 예외)를 반환.
+    - 이미 실행 중인 스레드는 중단할 수 없으므로 결과만 버리고 기다리지 않는다.
+    """
+    if max_workers <= 0:
+        raise ValueError("max_workers must be positive")
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    finished = False
+    try:
+        out = _traverse_in(executor, xs, f, max_workers)
+        finished = is_ok(out)
+        return out
+    finally:
+        # 모두 Ok 면 실행 중인 작업이 없으므로 스레드를 정리하고, 실패면 기다리지 않는다.
+        executor.shutdown(wait=finished, cancel_futures=True)
+
+
+def result_traverse_processes(
+    xs: Iterable[A],
+    f: Callable[[A], Result[B, E]],
+    max_workers: int | None = None,
+) -> Result[list[B], E]:
+    """result_traverse_threads 의 프로세스 풀 버전 (CPU 연산형 f).
+
+    - f, 입력, 결과는 pickle 가능해야 함 (모듈 최상위 함수).
+    - 동시 제출 수는 워커 수의 2배 이하.
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_workers <= 0:
+        raise ValueError("max_workers must be positive")
+    executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=_MP_CONTEXT)
+    try:
+        return _traverse_in(executor, xs, f, max_workers * 2)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def result_traverse_async(
+    xs: Iterable[A],
+    f: Callable[[A], Awaitable[Result[B, E]]],
+    limit: int = 8,
+) -> Result[list[B], E]:
+    """result_traverse 의 asyncio 버전: 비동기 f 를 최대 limit 개까지 동시에 실행한다.
+
+    - 결과 순서, 가장 왼쪽 Err 규칙은 result_traverse_threads 와 같음.
+    - Err 가 나오면 그보다 오른쪽의 실행 중 태스크까지 실제로 취소한다.
+    """
+    if limit <= 0:
+        raise ValueError("limit must be positive")
+    state: _TraverseState[B, E] = _TraverseState()
+    it = enumerate(xs)
+    pending: dict[asyncio.Future[Result[B, E]], int] = {}
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and state.fail_at is None and len(pending) < limit:
+                nxt = next(it, None)
+                if nxt is None:
+                    exhausted = True
+                    break
+                pending[asyncio.ensure_future(f(nxt[1]))] = nxt[0]
+            if not any(state.wanted(i) for i in pending.values()):
+                return state.result()
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                i = pending.pop(task)
+                if task.cancelled():
+                    continue
+                exc = task.exception()
+                state.record(i, None if exc is not None else task.result(), exc)
+            for task, i in pending.items():
+                if not state.wanted(i):
+                    task.cancel()
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+# -----------------------------
+# 열(columnar) 기반 Result 컨테이너
+# -----------------------------
+class ResultArray(Generic[T, E]):
+    """원소마다 Ok/Err 객체를 만들지 않는 Result 묶음.
+
+    - values: array.array 또는 numpy.ndarray. Err 자리의 값은 의미 없음(0).
+    - errors: {index: error} 희소 맵. 비어 있으면 전부 Ok.
+    - uniform: (error,) 이면 '모든 자리가 이 Err' (apply 에 Err 함수를 준 결과).
+      인덱스마다 항목을 만들지 않으며, 이때 errors 는 쓰지 않는다.
+    - 각 연산은 원소별 result_apply / result_to_maybe / result_sequence 와 같은 규칙.
+    """
+    __slots__ = ("values", "errors", "uniform")
+
+    def __init__(self, values: Any, errors: dict[int, E] | None = None, *, uniform: tuple[E] | None = None):
+        self.values = values
+        self.errors: dict[int, E] = {} if errors is None or uniform is not None else errors
+        self.uniform = uniform
+
+    @classmethod
+    def from_results(
+        cls,
+        results: Iterable[Result[T, E]],
+        typecode: str = "d",
+        *,
+        use_numpy: bool = False,
+    ) -> "ResultArray[T, E]":
+        """Iterable[Result] 를 열 형식으로 모은다. typecode 는 array.array 형식 문자."""
+        values = array(typecode)
+        append = values.append
+        errors: dict[int, E] = {}
+        for i, r in enumerate(results):
+            if is_err(r):
+                errors[i] = r.error
+                append(0)
+            else:
+                append(r.value)
+        if use_numpy:
+            if np is None:
+                raise ImportError("use_numpy=True requires numpy")
+            return cls(np.frombuffer(values, dtype=values.typecode), errors)
+        return cls(values, errors)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, i: int) -> Result[T, E]:
+        if i < 0:
+            i += len(self.values)
+        if not 0 <= i < len(self.values):
+            raise IndexError(i)
+        if self.uniform is not None:
+            return err(self.uniform[0])
+        if i in self.errors:
+            return err(self.errors[i])
+        v = self.values[i]
+        return ok(v.item() if np is not None and isinstance(v, np.generic) else v)
+
+    def __iter__(self) -> Iterator[Result[T, E]]:
+        return map(self.__getitem__, range(len(self.values)))
+
+    def __repr__(self) -> str:
+        n_err = len(self) if self.uniform is not None else len(self.errors)
+        return f"ResultArray(len={len(self)}, errors={n_err})"
+
+    def _is_numpy(self) -> bool:
+        return np is not None and isinstance(self.values, np.ndarray)
+
+    def ok_mask(self) -> Any:
+        """Ok 자리가 참인 마스크 (ndarray면 bool ndarray, 아니면 array('b'))."""
+        n = len(self.values)
+        if self.uniform is not None:
+            return np.zeros(n, dtype=bool) if self._is_numpy() else array("b", bytes(n))
+        if self._is_numpy():
+            mask = np.ones(n, dtype=bool)
+            if self.errors:
+                mask[np.fromiter(self.errors, dtype=np.intp, count=len(self.errors))] = False
+            return mask
+        mask = array("b", bytes([1])) * n
+        for i in self.errors:
+            mask[i] = 0
+        return mask
+
+    def map(self, f: Callable[[Any], Any], typecode: str | None = None) -> "ResultArray[U, E]":
+        """Ok 값에만 f 를 적용한다 (Err 는 그대로).
+
+        - ndarray: f 는 배열을 받는 벡터 함수(ufunc 등). Err 자리에는 적용하지 않는다.
+        - array.array: f 는 원소 함수. 결과 형식은 typecode (기본: 입력과 같음).
+        """
+        if self.uniform is not None:
+            return self._all_err(self.uniform, typecode)
+        if self._is_numpy():
+            if not self.errors:
+                return ResultArray(np.asarray(f(self.values)), dict(self.errors))
+            mask = self.ok_mask()
+            mapped = np.asarray(f(self.values[mask]))
+            out = np.zeros(len(self.values), dtype=mapped.dtype)
+            out[mask] = mapped
+            return ResultArray(out, dict(self.errors))
+        tc = typecode or self.values.typecode
+        if not self.errors:
+            return ResultArray(array(tc, map(f, self.values)), {})
+        errs = self.errors
+        out = array(tc, (0 if i in errs else f(v) for i, v in enumerate(self.values)))
+        return ResultArray(out, dict(errs))
+
+    def apply(self, rf: Result[Callable[[Any], Any], E], typecode: str | None = None) -> "ResultArray[U, E]":
+        """원소마다 result_apply(원소, rf) 와 같다: rf 가 Err 면 모든 원소가 그 Err."""
+        if is_err(rf):
+            return self._all_err((rf.error,), typecode)
+        return self.map(rf.value, typecode)
+
+    def _all_err(self, uniform: tuple[E], typecode: str | None) -> "ResultArray[U, E]":
+        n = len(self.values)
+        if self._is_numpy():
+            return ResultArray(np.zeros(n, dtype=self.values.dtype), uniform=uniform)
+        tc = typecode or self.values.typecode
+        return ResultArray(array(tc, bytes(array(tc).itemsize * n)), uniform=uniform)
+
+    def sequence(self) -> Result[Any, E]:
+        """result_sequence 와 같은 규칙: Err 가 있으면 가장 왼쪽 Err, 없으면 Ok(값 열 전체)."""
+        if self.uniform is not None and len(self.values):
+            return err(self.uniform[0])
+        if self.errors:
+            return err(self.errors[min(self.errors)])
+        return ok(self.values)
+
+    def to_maybe(self) -> tuple[Any, Any]:
+        """원소마다 result_to_maybe 를 적용한 것과 같은 (values, ok_mask) 쌍."""
+        return self.values, self.ok_mask()
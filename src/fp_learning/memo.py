@@ -0,0 +1,159 @@
+# path: fp_learning/memo.py
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable, Hashable
+from functools import update_wrapper
+from typing import Any, NamedTuple, TypeVar
+
+R = TypeVar("R")
+
+__all__ = ["CacheInfo", "memoize"]
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+    bytes: int
+    evictions: int
+    expirations: int
+
+
+class _NoLock:
+    """thread_safe=False 일 때 쓰는 아무 일도 하지 않는 락."""
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+
+_KWMARK = object()
+_FAST_TYPES = frozenset({int, str})
+
+
+def _make_key(args: tuple[Any, ...], kwargs: dict[str, Any]) -> Hashable:
+    if not kwargs and len(args) == 1 and type(args[0]) in _FAST_TYPES:
+        return args[0]
+    if not kwargs:
+        return args
+    return (*args, _KWMARK, *sorted(kwargs.items()))
+
+
+def memoize(
+    fn: Callable[..., R] | None = None,
+    *,
+    maxsize: int | None = 1024,
+    ttl: float | None = None,
+    max_bytes: int | None = None,
+    thread_safe: bool = False,
+    sizeof: Callable[[Any], int] = sys.getsizeof,
+    clock: Callable[[], float] = time.monotonic,
+) -> Any:
+    """순수 함수용 메모이제이션 데코레이터 (@memoize 또는 @memoize(...)).
+
+    요구사항
+    - 순수 함수에만 사용할 것 (같은 인자 -> 같은 결과, 부작용 없음). 인자는 해시 가능해야 함.
+    - maxsize: 최대 항목 수 (None 이면 무제한). 넘치면 가장 오래 안 쓴 항목부터 제거(LRU).
+    - ttl: 항목 수명(초). 지난 항목은 다음 조회 때, 그리고 새 항목을 넣을 때마다
+      만료 순서 큐의 앞에서부터 일괄 제거된다 (죽은 항목이 maxsize/max_bytes 를 차지하지 않음).
+    - max_bytes: sizeof(결과) 합계 상한. 기본 sizeof 는 sys.getsizeof (얕은 크기).
+      혼자서 상한을 넘는 결과는 캐시하지 않는다.
+    - thread_safe=True 면 캐시 조작을 락으로 보호. fn 호출 자체는 락 밖에서 하므로
+      같은 키가 동시에 처음 요청되면 두 번 계산될 수 있다 (순수 함수라 결과는 같음).
+    - wrapper.cache_info() -> CacheInfo, wrapper.cache_clear()
+    """
+    if maxsize is not None and maxsize < 0:
+        raise ValueError("maxsize must be non-negative")
+    if max_bytes is not None and max_bytes < 0:
+        raise ValueError("max_bytes must be non-negative")
+
+    def decorate(func: Callable[..., R]) -> Callable[..., R]:
+        cache: OrderedDict[Hashable, tuple[R, float, int]] = OrderedDict()
+        lock: Any = threading.RLock() if thread_safe else _NoLock()
+        stats = {"hits": 0, "misses": 0, "bytes": 0, "evictions": 0, "expirations": 0}
+        # ttl 이 고정이므로 삽입 순서 == 만료 순서. (만료 시각, 키) 를 순서대로 쌓아 둔다.
+        # 이미 지워졌거나 다시 넣어진 키의 항목은 만료 시각이 달라 건너뛴다.
+        expiry: deque[tuple[float, Hashable]] = deque()
+
+        def sweep() -> None:
+            if not expiry:
+                return
+            now = clock()
+            while expiry and expiry[0][0] <= now:
+                expires, key = expiry.popleft()
+                entry = cache.get(key)
+                if entry is not None and entry[1] == expires:
+                    del cache[key]
+                    stats["bytes"] -= entry[2]
+                    stats["expirations"] += 1
+
+        def evict() -> None:
+            while cache and (
+                (maxsize is not None and len(cache) > maxsize)
+                or (max_bytes is not None and stats["bytes"] > max_bytes)
+            ):
+                _, (_, _, nbytes) = cache.popitem(last=False)
+                stats["bytes"] -= nbytes
+                stats["evictions"] += 1
+
+        def wrapper(*args: Any, **kwargs: Any) -> R:
+            key = _make_key(args, kwargs)
+            with lock:
+                entry = cache.get(key)
+                if entry is not None:
+                    if ttl is None or clock() < entry[1]:
+                        cache.move_to_end(key)
+                        stats["hits"] += 1
+                        return entry[0]
+                    del cache[key]
+                    stats["bytes"] -= entry[2]
+                    stats["expirations"] += 1
+                stats["misses"] += 1
+            value = func(*args, **kwargs)
+            if maxsize == 0:
+                return value
+            nbytes = sizeof(value) if max_bytes is not None else 0
+            if max_bytes is not None and nbytes > max_bytes:
+                return value
+            expires = clock() + ttl if ttl is not None else 0.0
+            with lock:
+                sweep()
+                old = cache.pop(key, None)
+                if old is not None:
+                    stats["bytes"] -= old[2]
+                cache[key] = (value, expires, nbytes)
+                stats["bytes"] += nbytes
+                if ttl is not None:
+                    expiry.append((expires, key))
+                evict()
+            return value
+
+        def cache_info() -> CacheInfo:
+            with lock:
+                sweep()
+                return CacheInfo(
+                    stats["hits"], stats["misses"], maxsize, len(cache),
+                    stats["bytes"], stats["evictions"], stats["expirations"],
+                )
+
+        def cache_clear() -> None:
+            with lock:
+                cache.clear()
+                expiry.clear()
+                for k in stats:
+                    stats[k] = 0
+
+        update_wrapper(wrapper, func)
+        wrapper.cache_info = cache_info  # type: ignore[attr-defined]
+        wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorate(fn) if fn is not None else decorate
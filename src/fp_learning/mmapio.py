@@ -0,0 +1,186 @@
+# path: fp_learning/mmapio.py
+from __future__ import annotations
+
+import itertools
+import mmap
+import os
+from bisect import bisect_right
+from collections.abc import Iterator
+from typing import Any
+
+__all__ = ["MappedLines", "MappedRecords"]
+
+# 줄 위치를 찾을 때 한 번에 세어 보는 바이트 수 (bytes.count 로 블록 단위 스킵)
+_SCAN_BLOCK = 1 << 20
+
+
+class _Mapped:
+    """파일을 읽기 전용으로 mmap 하고 memoryview 를 들고 있는 공통 베이스."""
+
+    def __init__(self, path: str | os.PathLike[str]):
+        self.path = os.fspath(path)
+        with open(self.path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            # 빈 파일은 mmap 할 수 없으므로 빈 버퍼로 대신한다.
+            self._mm: Any = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        self._size = size
+        self._view = memoryview(self._mm)
+
+    @property
+    def closed(self) -> bool:
+        return self._view is None
+
+    def close(self) -> None:
+        """매핑 해제. 산출한 memoryview 가 남아 있으면 BufferError (먼저 release/삭제할 것).
+
+        BufferError 가 나면 뷰를 다시 만들어 두므로 소스는 열린 채 그대로 쓸 수 있다.
+        """
+        if self._view is None:
+            return
+        self._view.release()
+        if isinstance(self._mm, mmap.mmap):
+            try:
+                self._mm.close()
+            except BufferError:
+                self._view = memoryview(self._mm)
+                raise
+        self._view = None
+
+    def __enter__(self) -> Any:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+class MappedRecords(_Mapped):
+    """
+    고정 길이 레코드 바이너리 파일을 mmap 한 시퀀스형 소스.
+
+    요구사항
+    - 원소는 길이 record_size 의 memoryview 슬라이스 (복사 없음).
+    - header 바이트를 건너뛴 뒤부터 레코드로 본다. 끝에 남는 불완전 레코드는 무시.
+    - len / 인덱싱(음수 포함) / 반복 재시작 가능.
+    - drop(n): n * record_size 위치로 바로 이동해 나머지를 지연 산출 (O(1) 스킵).
+    - islice(start, stop) 로 SupportsISlice 를 구현 -> assignments_02 의 drop/take/batched 빠른 경로.
+    - with 문으로 닫기. 산출한 뷰를 쥔 채로 닫으면 BufferError.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], record_size: int, *, header: int = 0):
+        if record_size <= 0:
+            raise ValueError("record_size must be positive")
+        if header < 0:
+            raise ValueError("header must be non-negative")
+        super().__init__(path)
+        self.record_size = record_size
+        self.header = header
+        self._len = max(self._size - header, 0) // record_size
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, i: int) -> memoryview:
+        if i < 0:
+            i += self._len
+        if not 0 <= i < self._len:
+            raise IndexError("record index out of range")
+        start = self.header + i * self.record_size
+        return self._view[start:start + self.record_size]
+
+    def __iter__(self) -> Iterator[memoryview]:
+        return self.islice(0)
+
+    def islice(self, start: int, stop: int | None = None) -> Iterator[memoryview]:
+        """SupportsISlice: start..stop 번째 레코드 뷰를 지연 산출 (위치 계산만, O(1) 스킵)."""
+        view, size = self._view, self.record_size
+        count = self._len if stop is None else min(max(stop, 0), self._len)
+        begin = self.header + max(start, 0) * size
+        return (view[p:p + size] for p in range(begin, self.header + count * size, size))
+
+    def drop(self, n: int) -> Iterator[memoryview]:
+        return self.islice(max(n, 0))
+
+
+class MappedLines(_Mapped):
+    """
+    줄 단위(b"\\n" 구분) 텍스트/로그 파일을 mmap 한 시퀀스형 소스.
+
+    요구사항
+    - 원소는 줄 내용(개행 제외)의 memoryview 슬라이스 (복사 없음).
+      마지막 줄에 개행이 없어도 한 줄로 취급.
+    - drop(n): n번째 줄의 시작 위치를 찾아 거기서부터 지연 산출.
+      줄을 객체로 만들지 않고 1MiB 블록 단위 bytes.count 로 건너뛰며,
+      찾은 (줄 번호, 위치) 는 기억해 두어 이후 drop/인덱싱이 가까운 지점에서 출발.
+    - len 은 첫 호출 때 한 번 세고 캐시. 인덱싱(음수 포함) 지원.
+    - islice(start, stop) 로 SupportsISlice 를 구현 -> assignments_02 의 drop/take/batched 빠른 경로.
+    - with 문으로 닫기. 산출한 뷰를 쥔 채로 닫으면 BufferError.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]):
+        super().__init__(path)
+        self._mark_lines: list[int] = [0]
+        self._mark_pos: list[int] = [0]
+        self._len: int | None = None
+
+    def _line_offset(self, n: int) -> int:
+        """n번째 줄이 시작하는 바이트 위치 (줄이 없으면 파일 크기)."""
+        i = bisect_right(self._mark_lines, n) - 1
+        line, pos = self._mark_lines[i], self._mark_pos[i]
+        if line == n:
+            return pos
+        mm, size = self._mm, self._size
+        while pos < size:
+            end = min(pos + _SCAN_BLOCK, size)
+            block = mm[pos:end]
+            count = block.count(b"\n")
+            if line + count < n:
+                line += count
+                pos = end
+                continue
+            p = 0
+            for __ in range(n - line):
+                p = block.find(b"\n", p) + 1
+            line, pos = n, pos + p
+            break
+        if line != n:
+            return size
+        self._mark_lines.insert(i + 1, n)
+        self._mark_pos.insert(i + 1, pos)
+        return pos
+
+    def __len__(self) -> int:
+        if self._len is None:
+            count = sum(self._mm[p:p + _SCAN_BLOCK].count(b"\n") for p in range(0, self._size, _SCAN_BLOCK))
+            if self._size and self._mm[self._size - 1:self._size] != b"\n":
+                count += 1
+            self._len = count
+        return self._len
+
+    def __getitem__(self, i: int) -> memoryview:
+        if i < 0:
+            i += len(self)
+        pos = self._line_offset(i) if i >= 0 else self._size
+        if pos >= self._size:
+            raise IndexError("line index out of range")
+        end = self._mm.find(b"\n", pos)
+        return self._view[pos:end if end >= 0 else self._size]
+
+    def __iter__(self) -> Iterator[memoryview]:
+        return self._lines_from(0)
+
+    def islice(self, start: int, stop: int | None = None) -> Iterator[memoryview]:
+        """SupportsISlice: start 번째 줄 위치로 이동해 stop 전까지 지연 산출."""
+        lines = self._lines_from(self._line_offset(max(start, 0)))
+        return lines if stop is None else itertools.islice(lines, max(stop - max(start, 0), 0))
+
+    def drop(self, n: int) -> Iterator[memoryview]:
+        return self.islice(max(n, 0))
+
+    def _lines_from(self, pos: int) -> Iterator[memoryview]:
+        mm, view, size = self._mm, self._view, self._size
+        while pos < size:
+            end = mm.find(b"\n", pos)
+            if end < 0:
+                end = size
+            yield view[pos:end]
+            pos = end + 1
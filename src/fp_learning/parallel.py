@@ -0,0 +1,242 @@
+# path: fp_learning/parallel.py
+from __future__ import annotations
+
+import os
+import queue
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from functools import partial
+from itertools import islice
+from typing import Any, TypeVar
+
+from fp_learning._feed import DONE, Raised, read_into
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+__all__ = ["parallel_map", "parallel_flatmap", "parallel_stage"]
+
+# 적응형 청크: 워커에서 청크 하나가 대략 이 시간 동안 돌도록 크기를 조정한다.
+_TARGET_CHUNK_SECONDS = 0.05
+_MAX_CHUNKSIZE = 4096
+# parallel_flatmap: 전개 하나가 소비자보다 앞서 쌓아 둘 수 있는 원소 수
+_EXPAND_BUFFER = 64
+
+
+def _apply_chunk(fn: Callable[[T], U], chunk: tuple[T, ...]) -> tuple[list[U], float]:
+    """워커 프로세스에서 실행: 청크 전체에 fn을 적용하고 걸린 시간을 함께 돌려준다."""
+    t0 = time.perf_counter()
+    out = [fn(x) for x in chunk]
+    return out, time.perf_counter() - t0
+
+
+class _ChunkSizer:
+    """고정 chunksize 또는 측정된 원소당 시간으로부터 다음 청크 크기를 정한다."""
+
+    def __init__(self, chunksize: int | None):
+        self.fixed = chunksize is not None
+        self.size = chunksize if chunksize is not None else 1
+
+    def update(self, n: int, elapsed: float) -> None:
+        if self.fixed or n == 0:
+            return
+        if elapsed <= 0:
+            wanted = self.size * 2
+        else:
+            wanted = int(_TARGET_CHUNK_SECONDS * n / elapsed)
+        # 급격한 변화를 막기 위해 한 번에 2배까지만 늘리고 절반까지만 줄인다.
+        wanted = max(self.size // 2, min(wanted, self.size * 2))
+        self.size = max(1, min(wanted, _MAX_CHUNKSIZE))
+
+
+def parallel_map(
+    fn: Callable[[T], U],
+    iterable: Iterable[T],
+    workers: int | None = None,
+    chunksize: int | None = None,
+    *,
+    ordered: bool = True,
+    max_pending: int | None = None,
+) -> Iterator[U]:
+    """순수 함수 fn을 프로세스 풀에서 병렬로 적용해 결과를 지연 산출한다.
+
+    요구사항
+    - fn과 원소는 pickle 가능해야 함 (람다 불가, 모듈 최상위 함수 사용).
+    - ordered=True 면 입력 순서 유지, False 면 완료된 청크 순으로 산출.
+    - chunksize=None 이면 측정된 처리 시간에 맞춰 청크 크기를 적응 조정.
+    - 백프레셔: 동시에 떠 있는 청크는 max_pending(기본 workers*2)개 이하이므로
+      itertools.count 같은 무한 입력도 제한 없이 미리 읽지 않음.
+    - 소비자가 중간에 멈추면(close) 대기 중 작업을 취소하고 풀을 정리.
+    - pipe_iter 스테이지로 쓰려면 parallel_stage 사용.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 0:
+        raise ValueError("workers must be positive")
+    if chunksize is not None and chunksize <= 0:
+        raise ValueError("chunksize must be positive")
+    if max_pending is None:
+        max_pending = workers * 2
+    if max_pending <= 0:
+        raise ValueError("max_pending must be positive")
+    return _parallel_map(fn, iter(iterable), workers, _ChunkSizer(chunksize), ordered, max_pending)
+
+
+def _bounded(
+    executor: Executor,
+    submit_next: Callable[[], Future[Any] | None],
+    ordered: bool,
+    max_pending: int,
+) -> Iterator[Any]:
+    """제출 상한이 있는 실행 루프: 떠 있는 작업을 max_pending 개 이하로 유지하며 결과를 산출.
+
+    - submit_next() 는 다음 작업을 제출해 Future 를, 입력이 끝났으면 None 을 돌려준다.
+      결과를 하나 산출한 뒤에야 다음 제출이 일어나므로 호출자가 그 사이 상태(청크 크기 등)를 바꿀 수 있다.
+    - ordered=True 면 제출 순서대로, False 면 완료 순서대로 결과를 산출.
+    - 종료(소진/예외/close) 시 대기 중 작업을 취소하고 executor 를 정리한다.
+    """
+    pending: deque[Future[Any]] = deque()
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < max_pending:
+                fut = submit_next()
+                if fut is None:
+                    exhausted = True
+                    break
+                pending.append(fut)
+            if not pending:
+                return
+            if ordered:
+                fut = pending.popleft()
+            else:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                fut = next(f for f in pending if f in finished)
+                pending.remove(fut)
+            yield fut.result()
+    finally:
+        for fut in pending:
+            fut.cancel()
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _parallel_map(
+    fn: Callable[[T], U],
+    it: Iterator[T],
+    workers: int,
+    sizer: _ChunkSizer,
+    ordered: bool,
+    max_pending: int,
+) -> Iterator[U]:
+    executor = ProcessPoolExecutor(max_workers=workers)
+
+    def submit_next() -> Future[tuple[list[U], float]] | None:
+        chunk = tuple(islice(it, sizer.size))
+        return executor.submit(_apply_chunk, fn, chunk) if chunk else None
+
+    chunks = _bounded(executor, submit_next, ordered, max_pending)
+    try:
+        for results, elapsed in chunks:
+            sizer.update(len(results), elapsed)
+            yield from results
+    finally:
+        chunks.close()
+
+
+def _expansion(fn: Callable[[T], Iterable[U]], x: T) -> Iterator[U]:
+    """fn(x) 호출까지 워커 안에서 일어나도록 감싼다 (호출 중 예외도 read_into 가 전달)."""
+    yield from fn(x)
+
+
+def parallel_flatmap(
+    fn: Callable[[T], Iterable[U]],
+    iterable: Iterable[T],
+    workers: int | None = None,
+    *,
+    ordered: bool = True,
+    max_pending: int | None = None,
+) -> Iterator[U]:
+    """lazy_flatmap 의 동시 실행 버전: fn(x) 전개를 스레드 풀에서 겹쳐 수행한다.
+
+    요구사항
+    - fn 이 파일 파싱/쿼리 fan-out 처럼 대기 시간이 긴 전개일 때 사용 (스레드라 람다도 가능).
+    - workers=None 이면 ThreadPoolExecutor 기본값과 같은 min(32, cpu 수 + 4).
+    - 각 fn(x) 전개는 워커가 크기 제한 큐(전개당 _EXPAND_BUFFER 개)로 흘려보내며,
+      소비자는 전개가 끝나기 전에도 원소를 받는다 (무한 전개 + islice 도 멈추지 않음).
+    - ordered=True 면 입력 순서대로, False 면 먼저 나온 원소부터 산출
+      (전개끼리는 섞일 수 있으나 한 전개 안의 원소 순서는 항상 유지).
+    - 동시에 떠 있는 전개는 max_pending(기본 workers*2)개 이하.
+      입력은 그만큼만 앞서 읽으므로 무한 입력 + islice 에서도 작업이 무한히 늘지 않음.
+    - 첫 next() 전에는 아무 작업도 시작하지 않음 (지연).
+    - fn 예외는 해당 전개 차례에 그대로 전파. 소비자가 멈추면(close) 대기 작업을 취소.
+    """
+    if workers is None:
+        workers = min(32, (os.cpu_count() or 1) + 4)
+    if workers <= 0:
+        raise ValueError("workers must be positive")
+    if max_pending is None:
+        max_pending = workers * 2
+    if max_pending <= 0:
+        raise ValueError("max_pending must be positive")
+    return _parallel_flatmap(fn, iter(iterable), workers, ordered, max_pending)
+
+
+def _parallel_flatmap(
+    fn: Callable[[T], Iterable[U]],
+    it: Iterator[T],
+    workers: int,
+    ordered: bool,
+    max_pending: int,
+) -> Iterator[U]:
+    executor = ThreadPoolExecutor(max_workers=workers)
+    stop = threading.Event()
+    # ordered 면 전개마다 큐 하나, 아니면 모든 전개가 한 큐를 나눠 쓴다 (DONE 개수로 완료를 센다).
+    shared: queue.Queue[Any] | None = None if ordered else queue.Queue(maxsize=_EXPAND_BUFFER * max_pending)
+    pending: deque[queue.Queue[Any]] = deque()
+    running = 0
+
+    def submit_next() -> bool:
+        for x in it:
+            q = shared
+            if q is None:
+                q = queue.Queue(maxsize=_EXPAND_BUFFER)
+                pending.append(q)
+            executor.submit(read_into, _expansion(fn, x), q, stop)
+            return True
+        return False
+
+    try:
+        exhausted = False
+        while True:
+            while not exhausted and running < max_pending:
+                if not submit_next():
+                    exhausted = True
+                    break
+                running += 1
+            if not running:
+                return
+            item = (pending[0] if shared is None else shared).get()
+            if item is DONE:
+                running -= 1
+                if shared is None:
+                    pending.popleft()
+            elif isinstance(item, Raised):
+                raise item.exc
+            else:
+                yield item
+    finally:
+        # 막힌 put 은 stop 을 보고 빠져나오고, read_into 가 각 전개를 워커 스레드에서 닫는다.
+        stop.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def parallel_stage(fn: Callable[[Any], Any], **options: Any) -> Callable[[Iterable[Any]], Iterator[Any]]:
+    """pipe_iter 에 그대로 꽂을 수 있는 (Iterable) -> Iterator 스테이지를 만든다.
+
+    예)
+        pipe_iter(data, parallel_stage(parse, workers=4), keep_valid)
+    """
+    return partial(parallel_map, fn, **options)
@@ -0,0 +1,168 @@
+# path: tests/test_aio.py
+import asyncio
+import itertools as it
+import time
+
+import pytest
+
+from fp_learning import aio as AIO
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+async def alist(ait):
+    return [x async for x in ait]
+
+async def acount(start=0):
+    n = start
+    while True:
+        yield n
+        n += 1
+
+async def atake_list(n, ait):
+    return await alist(AIO.atake(n, ait))
+
+
+# -------------------------
+# 기능 테스트
+# -------------------------
+def test_acountdown_basic_and_protocol():
+    assert run(alist(AIO.ACountdown(3))) == [3, 2, 1]
+    assert run(alist(AIO.ACountdown(0))) == []
+    assert run(alist(AIO.ACountdown(-2))) == []
+    with pytest.raises(TypeError):
+        AIO.ACountdown(1.5)
+
+def test_abatched_matches_batched():
+    assert run(alist(AIO.abatched([1, 2, 3, 4, 5], 2))) == [(1, 2), (3, 4), (5,)]
+    assert run(alist(AIO.abatched(AIO.ACountdown(4), 2))) == [(4, 3), (2, 1)]
+    assert run(atake_list(2, AIO.abatched(acount(1), 3))) == [(1, 2, 3), (4, 5, 6)]
+    with pytest.raises(ValueError):
+        run(alist(AIO.abatched([1], 0)))
+
+def test_atake_adrop():
+    data = [0, 1, 2, 3, 4]
+    assert run(alist(AIO.atake(3, data))) == [0, 1, 2]
+    assert run(alist(AIO.adrop(3, data))) == [3, 4]
+    assert run(alist(AIO.atake(0, data))) == []
+    assert run(alist(AIO.adrop(0, data))) == data
+    assert run(alist(AIO.adrop(10, data))) == []
+    assert run(atake_list(3, AIO.adrop(100, acount()))) == [100, 101, 102]
+
+def test_atake_does_not_overpull():
+    async def main():
+        src = AIO.aiter_of(it.count(10))
+        first = await alist(AIO.atake(3, src))
+        second = await alist(AIO.atake(2, src))
+        return first, second
+    assert run(main()) == ([10, 11, 12], [13, 14])
+
+def test_alazy_flatmap_sync_and_async_children():
+    async def children(n):
+        for i in range(n):
+            yield i
+    assert run(alist(AIO.alazy_flatmap(lambda x: [x, x], [1, 2]))) == [1, 1, 2, 2]
+    assert run(alist(AIO.alazy_flatmap(children, [0, 2, 3]))) == [0, 1, 0, 1, 2]
+    assert run(atake_list(4, AIO.alazy_flatmap(lambda n: [n], acount()))) == [0, 1, 2, 3]
+
+
+async def double(ait):
+    async for x in ait:
+        yield x * 2
+
+async def evens(ait):
+    async for x in ait:
+        if x % 2 == 0:
+            yield x
+
+@pytest.mark.parametrize("buffer", [0, 1, 4])
+def test_apipe_iter_chains_lazily(buffer):
+    out = AIO.apipe_iter(acount(1), evens, double, buffer=buffer)
+    assert run(atake_list(4, out)) == [4, 8, 12, 16]
+    assert run(alist(AIO.apipe_iter([1, 2, 3], buffer=buffer))) == [1, 2, 3]
+
+@pytest.mark.parametrize("buffer", [0, 2])
+def test_apipe_iter_propagates_errors(buffer):
+    async def boom(ait):
+        async for x in ait:
+            if x == 3:
+                raise RuntimeError("boom")
+            yield x
+    with pytest.raises(RuntimeError):
+        run(alist(AIO.apipe_iter(range(10), boom, buffer=buffer)))
+
+def test_apipe_iter_buffer_overlaps_slow_stages():
+    async def slow_source():
+        for i in range(8):
+            await asyncio.sleep(0.02)
+            yield i
+
+    async def slow_stage(ait):
+        async for x in ait:
+            await asyncio.sleep(0.02)
+            yield x
+
+    async def timed(buffer):
+        t0 = time.perf_counter()
+        out = await alist(AIO.apipe_iter(slow_source(), slow_stage, buffer=buffer))
+        return out, time.perf_counter() - t0
+
+    seq_out, seq_t = run(timed(0))
+    con_out, con_t = run(timed(4))
+    assert seq_out == con_out == list(range(8))
+    # 순차: ~16 * 20ms, 동시: ~9 * 20ms
+    assert con_t < seq_t * 0.8
+
+def test_apipe_iter_early_stop_cancels_tasks():
+    async def main():
+        out = AIO.apipe_iter(acount(), double, buffer=2)
+        first = await alist(AIO.atake(3, out))
+        await out.aclose()
+        await asyncio.sleep(0)
+        pending = [t for t in asyncio.all_tasks()
+                   if getattr(t.get_coro(), "__name__", "") == "_pump" and not t.done()]
+        return first, pending
+    first, pending = run(main())
+    assert first == [0, 2, 4]
+    assert pending == []
+
+
+# -------------------------
+# 크기 + 시간 제한 배치
+# -------------------------
+def test_abatched_timed_size_and_deadline():
+    async def feed():
+        yield 1
+        yield 2
+        await asyncio.sleep(0.3)
+        yield 3
+
+    async def main():
+        t0 = time.perf_counter()
+        out = AIO.abatched_timed(feed(), 10, max_wait=0.05)
+        first = await anext(out)
+        elapsed = time.perf_counter() - t0
+        rest = await alist(out)
+        return first, elapsed, rest
+
+    first, elapsed, rest = run(main())
+    assert first == (1, 2) and elapsed < 0.25
+    assert rest == [(3,)]
+    assert run(alist(AIO.abatched_timed(range(7), 3, 5.0))) == [(0, 1, 2), (3, 4, 5), (6,)]
+
+def test_abatched_timed_slow_consumer_keeps_full_batches():
+    async def main():
+        sizes = []
+        async for batch in AIO.abatched_timed(range(80), 8, max_wait=0.01):
+            sizes.append(len(batch))
+            await asyncio.sleep(0.02)
+        return sizes
+    sizes = run(main())
+    assert sum(sizes) == 80
+    assert all(n == 8 for n in sizes[1:]), sizes
+
+def test_abatched_timed_infinite_and_invalid():
+    assert run(atake_list(2, AIO.abatched_timed(acount(), 2, 1.0))) == [(0, 1), (2, 3)]
+    with pytest.raises(ValueError):
+        run(alist(AIO.abatched_timed([1], 0, 1.0)))
@@ -45,3 +45,69 @@ def test_style_constraints():
     _assert_uses_map_and_no_for(A_01.assignment1)
     _assert_uses_map_and_no_for(A_01.assignment2)
     _assert_uses_map_and_no_for(A_01.assignment3)
+
+# ---- 배열 백엔드 ----
+def test_array_backend_falls_back_to_list_for_plain_iterables():
+    assert A_01.assignment1_array([1, 2, 3]) == [1, 8, 27]
+    assert A_01.assignment2_array(["a", "bb"]) == [1, 2]
+    assert A_01.assignment3_array(iter([10, 20])) == [5.0, 10.0]
+
+def test_array_backend_numpy_inputs():
+    np = pytest.importorskip("numpy")
+    out1 = A_01.assignment1_array(np.array([1, 2, 3]))
+    assert isinstance(out1, np.ndarray) and out1.tolist() == [1, 8, 27]
+    out2 = A_01.assignment2_array(np.array(["Python", "", "ab"]))
+    assert out2.tolist() == [6, 0, 2]
+    out2_obj = A_01.assignment2_array(np.array(["abc", "d"], dtype=object))
+    assert out2_obj.tolist() == [3, 1]
+    out3 = A_01.assignment3_array(np.array([10, 20, 30]))
+    assert out3.dtype.kind == "f" and out3.tolist() == [5.0, 10.0, 15.0]
+
+def test_array_backend_buffer_protocol_inputs():
+    np = pytest.importorskip("numpy")
+    import array
+    out1 = A_01.assignment1_array(array.array("q", [0, -1, 2]))
+    assert isinstance(out1, np.ndarray) and out1.tolist() == [0, -1, 8]
+    out3 = A_01.assignment3_array(array.array("d", [1.0, 3.0]))
+    assert out3.tolist() == [0.5, 1.5]
+
+def test_array_backend_upcasts_narrow_integers():
+    np = pytest.importorskip("numpy")
+    import array
+    assert A_01.assignment1_array(array.array("i", [2000, -3])).tolist() == [8_000_000_000, -27]
+    out = A_01.assignment1_array(b"\x07\x10")
+    assert out.dtype == np.int64 and out.tolist() == [343, 4096]
+    assert A_01.assignment1_array(np.array([True, False])).tolist() == [1, 0]
+    assert A_01.assignment1_array(np.array([2.0], dtype=np.float32)).dtype == np.float32
+
+# ---- 스트리밍 / 청크 버전 ----
+def test_iter_variants_are_lazy_on_infinite_input():
+    import itertools as it
+    assert list(it.islice(A_01.iter_assignment1(it.count(1)), 3)) == [1, 8, 27]
+    assert list(it.islice(A_01.iter_assignment2(it.repeat("ab")), 2)) == [2, 2]
+    assert list(it.islice(A_01.iter_assignment3(it.count(10, 10)), 2)) == [5.0, 10.0]
+
+def test_chunked_variants_yield_typed_arrays():
+    import array
+    chunks = list(A_01.chunked_assignment1(range(1, 6), size=2))
+    assert [c.tolist() for c in chunks] == [[1, 8], [27, 64], [125]]
+    assert all(isinstance(c, array.array) and c.typecode == "q" for c in chunks)
+    (c2,) = A_01.chunked_assignment2(["", "ab"], size=4)
+    assert c2.typecode == "q" and c2.tolist() == [0, 2]
+    (c3,) = A_01.chunked_assignment3([1, 3], size=4)
+    assert c3.typecode == "d" and c3.tolist() == [0.5, 1.5]
+    assert list(A_01.chunked_assignment1([], size=3)) == []
+
+def test_chunked_variants_infinite_and_invalid_size():
+    import itertools as it
+    first = next(A_01.chunked_assignment1(it.count(1), size=3))
+    assert first.tolist() == [1, 8, 27]
+    with pytest.raises(ValueError):
+        next(A_01.chunked_assignment3([1], size=0))
+
+def test_chunked_output_feeds_batched():
+    import itertools as it
+    from fp_learning import assignments_02 as A_02
+    chunks = A_01.chunked_assignment1(it.count(1), size=4)
+    flat = it.chain.from_iterable(chunks)
+    assert next(A_02.batched(flat, 3)) == (1, 8, 27)
@@ -114,3 +114,212 @@ def test_style_take_drop_are_lazy():
         assert not _uses_call_name(t, "list"), f"{fn.__name__}에서 list(materialize) 금지"
         assert _has_yield(t) or _uses_call_name(t, "islice"), \
             f"{fn.__name__}는 yield 또는 itertools.islice 등 지연 수단을 사용해야 합니다."
+
+
+# -------------------------
+# itertools 기반 버전: 원본과 동일하게 동작하는지
+# -------------------------
+_SOURCES = [
+    lambda: [],
+    lambda: [1],
+    lambda: list(range(10)),
+    lambda: iter(range(7)),
+    lambda: (x * x for x in range(5)),
+    lambda: "abcdef",
+]
+
+@pytest.mark.parametrize("make", _SOURCES)
+@pytest.mark.parametrize("k", [1, 2, 3, 10])
+def test_batched_fast_matches_batched(make, k):
+    assert list(A_02.batched_fast(make(), k)) == list(A_02.batched(make(), k))
+
+@pytest.mark.parametrize("make", _SOURCES)
+@pytest.mark.parametrize("n", [-3, 0, 1, 4, 100])
+def test_take_drop_fast_match_originals(make, n):
+    assert list(A_02.take_fast(n, make())) == list(A_02.take(n, make()))
+    assert list(A_02.drop_fast(n, make())) == list(A_02.drop(n, make()))
+
+def test_batched_fast_invalid_k():
+    for k in (0, -1):
+        out = A_02.batched_fast([1, 2, 3], k)  # 호출만으로는 예외 없음 (batched 와 동일)
+        with pytest.raises(ValueError):
+            next(out)
+
+def test_fast_versions_infinite_and_resumable():
+    stream = it.count(1)
+    assert list(it.islice(A_02.batched_fast(stream, 4), 2)) == [(1, 2, 3, 4), (5, 6, 7, 8)]
+
+    stream = it.count(10)
+    assert list(A_02.take_fast(5, stream)) == [10, 11, 12, 13, 14]
+    assert list(A_02.take_fast(3, stream)) == [15, 16, 17]
+
+    dropped = A_02.drop_fast(100, it.count(0))
+    assert list(it.islice(dropped, 5)) == [100, 101, 102, 103, 104]
+
+def test_fast_versions_are_lazy():
+    pulled = []
+
+    def src():
+        for x in range(100):
+            pulled.append(x)
+            yield x
+
+    t = A_02.take_fast(3, src())
+    b = A_02.batched_fast(src(), 2)
+    d = A_02.drop_fast(5, src())
+    assert pulled == []
+    next(t), next(b), next(d)
+    assert len(pulled) == 1 + 2 + 6
+
+def test_fast_versions_do_not_touch_islice_sources_until_iterated():
+    c = A_02.Countdown(5)
+    A_02.drop_fast(2, c)
+    A_02.take_fast(3, c)
+    assert next(c) == 5
+
+
+# -------------------------
+# 버퍼 기반 무복사 배치
+# -------------------------
+def test_batched_buffer_bytes_and_bytearray_are_views():
+    data = bytearray(b"abcdefg")
+    out = list(A_02.batched_buffer(data, 3))
+    assert all(isinstance(b, memoryview) for b in out)
+    assert [bytes(b) for b in out] == [b"abc", b"def", b"g"]
+    data[0] = ord("z")  # 뷰이므로 원본 변경이 보인다
+    assert bytes(out[0]) == b"zbc"
+    assert [bytes(b) for b in A_02.batched_buffer(b"abcd", 2)] == [b"ab", b"cd"]
+
+def test_batched_buffer_array_array_keeps_format():
+    import array
+    out = list(A_02.batched_buffer(array.array("d", [1.0, 2.0, 3.0]), 2))
+    assert [b.tolist() for b in out] == [[1.0, 2.0], [3.0]]
+    assert out[0].format == "d"
+
+def test_batched_buffer_numpy_yields_array_views():
+    np = pytest.importorskip("numpy")
+    frames = np.arange(12).reshape(6, 2)
+    out = list(A_02.batched_buffer(frames, 4))
+    assert [b.shape for b in out] == [(4, 2), (2, 2)]
+    assert all(isinstance(b, np.ndarray) and np.shares_memory(b, frames) for b in out)
+
+def test_batched_buffer_iterators_use_tuple_path():
+    assert list(A_02.batched_buffer(iter([1, 2, 3]), 2)) == [(1, 2), (3,)]
+    first = next(A_02.batched_buffer(it.count(1), 3))
+    assert first == (1, 2, 3)
+
+def test_batched_buffer_invalid_k_and_empty():
+    with pytest.raises(ValueError):
+        list(A_02.batched_buffer(b"abc", 0))
+    assert list(A_02.batched_buffer(b"", 2)) == []
+
+
+# -------------------------
+# 크기 + 시간 제한 배치
+# -------------------------
+def _slow(items, delay):
+    import time
+    for x in items:
+        time.sleep(delay)
+        yield x
+
+def test_batched_timed_size_bound_matches_batched():
+    data = list(range(10))
+    assert list(A_02.batched_timed(data, 3, max_wait=5.0)) == list(A_02.batched(data, 3))
+    assert list(A_02.batched_timed([], 3, max_wait=1.0)) == []
+
+def test_batched_timed_flushes_on_deadline():
+    import time
+    def feed():
+        yield 1
+        yield 2
+        time.sleep(0.3)
+        yield 3
+    t0 = time.monotonic()
+    out = A_02.batched_timed(feed(), 10, max_wait=0.05)
+    first = next(out)
+    assert first == (1, 2)
+    assert time.monotonic() - t0 < 0.25
+    assert list(out) == [(3,)]
+
+def test_batched_timed_slow_consumer_keeps_full_batches():
+    import time
+    sizes = []
+    for batch in A_02.batched_timed(range(80), 8, max_wait=0.01):
+        sizes.append(len(batch))
+        time.sleep(0.02)
+    assert sum(sizes) == 80
+    assert all(n == 8 for n in sizes[1:]), sizes
+
+def test_batched_timed_infinite_source_and_early_close():
+    out = A_02.batched_timed(it.count(), 4, max_wait=1.0)
+    assert next(out) == (0, 1, 2, 3)
+    out.close()
+
+def test_batched_timed_invalid_args_and_errors():
+    with pytest.raises(ValueError):
+        list(A_02.batched_timed([1], 0, 1.0))
+    with pytest.raises(ValueError):
+        list(A_02.batched_timed([1], 1, -1.0))
+
+    def broken():
+        yield 1
+        raise RuntimeError("feed")
+    with pytest.raises(RuntimeError):
+        list(A_02.batched_timed(broken(), 5, 1.0))
+
+
+# -------------------------
+# SupportsISlice 빠른 경로
+# -------------------------
+_SLICEABLE = [
+    lambda: range(10),
+    lambda: list(range(10)),
+    lambda: tuple(range(10)),
+    lambda: range(0),
+    lambda: [],
+]
+
+@pytest.mark.parametrize("make", _SLICEABLE)
+@pytest.mark.parametrize("n", [-1, 0, 1, 3, 10, 15])
+def test_fast_path_matches_generic_on_sequences(make, n):
+    generic = list(make())
+    for fn, fast in ((A_02.take, A_02.take_fast), (A_02.drop, A_02.drop_fast)):
+        want = list(fn(n, iter(generic)))
+        assert list(fn(n, make())) == want
+        assert list(fast(n, make())) == want
+    if n > 0:
+        assert list(A_02.batched(make(), n)) == list(A_02.batched(iter(generic), n))
+
+def test_countdown_supports_islice_and_keeps_position():
+    assert isinstance(A_02.Countdown(3), A_02.SupportsISlice)
+    c = A_02.Countdown(10)
+    assert list(A_02.take(3, c)) == [10, 9, 8]
+    assert list(A_02.take(2, A_02.drop(2, c))) == [5, 4]
+    assert list(c) == [3, 2, 1]
+    assert list(A_02.drop(5, A_02.Countdown(3))) == []
+    assert list(A_02.drop(-1, A_02.Countdown(2))) == [2, 1]
+    assert list(A_02.batched(A_02.Countdown(5), 2)) == [(5, 4), (3, 2), (1,)]
+    assert list(A_02.take(3, A_02.Countdown(-2))) == []
+
+def test_drop_on_huge_range_and_countdown_is_constant_time():
+    import time
+    t0 = time.perf_counter()
+    assert next(A_02.drop(10**9, range(10**9 + 5))) == 10**9
+    assert next(A_02.drop_fast(10**12, A_02.Countdown(10**12 + 1))) == 1
+    assert list(A_02.take(2, A_02.drop(10**15, range(10**18)))) == [10**15, 10**15 + 1]
+    assert time.perf_counter() - t0 < 0.1
+
+def test_custom_source_can_advertise_islice():
+    class Squares:
+        def __init__(self):
+            self.calls = []
+        def __iter__(self):
+            return (i * i for i in it.count())
+        def islice(self, start, stop=None):
+            self.calls.append((start, stop))
+            return (i * i for i in (it.count(start) if stop is None else range(start, stop)))
+    sq = Squares()
+    assert list(A_02.take(3, A_02.drop(10**6, sq))) == [10**12, (10**6 + 1) ** 2, (10**6 + 2) ** 2]
+    assert list(it.islice(A_02.batched(sq, 2), 2)) == [(0, 1), (4, 9)]
+    assert sq.calls == [(10**6, None), (0, None)]
@@ -137,3 +137,187 @@ def test_style_process_numbers_pipeline_prefers_comprehensions_no_try():
     assert not _has_try(t), "process_numbers_pipeline: try/except 대신 to_int_or_none를 사용하세요."
     # 헬퍼 사용 권장
     assert _uses_call_name(t, "to_int_or_none"), "process_numbers_pipeline: to_int_or_none를 사용하세요."
+
+
+# -------------------------
+# 슬롯/싱글턴 Maybe
+# -------------------------
+def test_nothing_is_singleton_and_just_is_slotted():
+    assert A_03.Nothing() is A_03.Nothing()
+    assert A_03.maybe(None) is A_03.Nothing()
+    assert A_03.to_int_or_none("x") is A_03.Nothing()
+    assert not hasattr(A_03.Just(1), "__dict__")
+    assert not hasattr(A_03.Nothing(), "__dict__")
+    assert A_03.Just(3) == A_03.Just(3)
+
+def test_keep_if_and_map_reuse_wrappers():
+    j = A_03.Just(10)
+    assert j.flatmap(A_03.keep_if(lambda n: n > 5)) is j
+    assert j.flatmap(A_03.keep_if(lambda n: n > 50)) is A_03.Nothing()
+    assert j.map(lambda n: n) is j
+    assert j.map(lambda n: n + 1) == A_03.Just(11)
+    # keep_if 는 여전히 일반 함수처럼 호출 가능
+    assert A_03.keep_if(lambda n: n > 0)(1) == A_03.Just(1)
+    assert A_03.keep_if(lambda n: n > 0)(-1) is A_03.Nothing()
+
+def test_flatmap_keep_if_swallows_predicate_errors():
+    j = A_03.Just("a")
+    assert j.flatmap(A_03.keep_if(lambda n: n > 0)) is A_03.Nothing()
+
+
+# -------------------------
+# process_numbers_batch: Maybe 체인 버전과 동일한 결과
+# -------------------------
+_MESSY = ['10', '-', '20', 'x', '7', ' 12 ', '+14', '-16', '1_000', '١٢', '12.0', '',
+          '0x10', '-0', '\t18\n', '4', '-10', '99999999999999999998', '3037000500']
+
+@pytest.mark.parametrize(
+    "strings",
+    [
+        [],
+        ['10', '-', '20', 'x', '7'],
+        ['50', '3', '-2', 'oops', '0'],
+        _MESSY,
+        [str(i) for i in range(-300, 300)],
+    ],
+)
+def test_process_numbers_batch_matches_pipeline(strings):
+    assert A_03.process_numbers_batch(strings) == A_03.process_numbers_pipeline(strings)
+    assert A_03.process_numbers_batch(iter(strings)) == A_03.process_numbers_pipeline(strings)
+
+def test_process_numbers_batch_bytes_and_non_strings():
+    data = [b'10', b'x', 12, None, 3.0, b'-20']
+    assert A_03.process_numbers_batch(data) == A_03.process_numbers_pipeline(data)
+
+def test_process_numbers_batch_numpy_blocks(monkeypatch):
+    np = pytest.importorskip("numpy")
+    monkeypatch.setattr(A_03, "_BATCH_BLOCK", 5)
+    clean = [str(i) for i in range(-40, 40)]
+    for data in (clean, _MESSY, clean + _MESSY + clean):
+        expected = A_03.process_numbers_pipeline(data)
+        assert A_03.process_numbers_batch(np.array(data)) == expected
+        encodable = [s for s in data if s.isascii()]
+        expected_b = A_03.process_numbers_pipeline([s.encode() for s in encodable])
+        assert A_03.process_numbers_batch(np.array([s.encode() for s in encodable])) == expected_b
+
+
+# -------------------------
+# safe_get_in falsy 값 / 컴파일된 경로 접근자
+# -------------------------
+@pytest.mark.parametrize("value", [0, "", {}, [], False])
+def test_safe_get_in_keeps_falsy_values(value):
+    d = {'a': {'b': value}}
+    assert A_03.safe_get_in(d, ['a', 'b']) == A_03.Just(value)
+    assert A_03.compile_path(['a', 'b'])(d) == A_03.Just(value)
+
+def test_compile_path_matches_safe_get_in_and_is_cached():
+    docs = [
+        {'a': {'b': {'c': 42}}},
+        {'a': {'x': 1}},
+        {'a': None},
+        {},
+        {'a': {'b': {'c': None}}},
+    ]
+    get = A_03.compile_path(['a', 'b', 'c'])
+    for d in docs:
+        assert get(d) == A_03.safe_get_in(d, ['a', 'b', 'c'])
+    assert A_03.compile_path(('a', 'b', 'c')) is get
+    assert A_03.compile_path("a.b.c") is get
+    assert A_03.compile_path([])({'k': 1}) == A_03.Just({'k': 1})
+
+def test_compile_path_non_dict_intermediate_is_nothing():
+    get = A_03.compile_path("a.b")
+    assert get({'a': 'text'}) is A_03.Nothing()
+    assert get({'a': [1, 2]}) is A_03.Nothing()
+
+def test_get_in_many_maybe_and_dense():
+    records = [{'u': {'age': 0}}, {'u': {}}, {'u': {'age': 31}}, {'v': 1}]
+    out = A_03.get_in_many(records, ['u', 'age'])
+    assert out == [A_03.Just(0), A_03.Nothing(), A_03.Just(31), A_03.Nothing()]
+    values, mask = A_03.get_in_many(iter(records), "u.age", dense=True, default=-1)
+    assert values == [0, -1, 31, -1]
+    assert mask == [True, False, True, False]
+
+
+# -------------------------
+# 다중 경로 프로젝션
+# -------------------------
+_DOC = {
+    'user': {'name': 'kim', 'age': 0, 'address': {'city': 'Seoul', 'zip': None}},
+    'tags': 'x',
+}
+_PATHS = ['user.name', 'user.age', 'user.address.city', 'user.address.zip',
+          'user.phone', 'tags', 'tags.inner', 'user', 'user.name']
+
+def test_project_matches_single_path_getters():
+    p = A_03.project(_PATHS)
+    J, N = A_03.Just, A_03.Nothing()
+    assert p(_DOC) == (J('kim'), J(0), J('Seoul'), N, N, J('x'), N, J(_DOC['user']), J('kim'))
+    docs = [_DOC, {}, {'user': None}, {'user': {'address': 'flat'}}, {'user': {'address': {}}}]
+    for d in docs:
+        assert p(d) == tuple(A_03.compile_path(path)(d) for path in _PATHS)
+
+def test_project_is_cached_and_handles_edge_paths():
+    assert A_03.project(_PATHS) is A_03.project([p.split('.') for p in _PATHS])
+    assert A_03.project([])(_DOC) == ()
+    assert A_03.project([[]])(_DOC) == (A_03.Just(_DOC),)
+
+def test_project_handles_very_deep_paths():
+    depth = 300
+    keys = [f"k{i}" for i in range(depth)]
+    doc = leaf = {}
+    for key in keys[:-1]:
+        leaf[key] = {}
+        leaf = leaf[key]
+    leaf[keys[-1]] = "bottom"
+    shallow = keys[:5]
+    p = A_03.project([keys, shallow, keys[:-1] + ["nope"]])
+    assert p(doc) == (A_03.Just("bottom"), A_03.compile_path(shallow)(doc), A_03.Nothing())
+    assert p(doc) == tuple(A_03.safe_get_in(doc, path) for path in p.paths)
+    assert p({"k0": None}) == (A_03.Nothing(),) * 3
+
+def test_projection_columns_maybe_and_dense():
+    p = A_03.project(['user.age', 'user.address.city'])
+    records = [_DOC, {'user': {'age': 5}}, {}]
+    ages, cities = p.columns(records)
+    assert ages == [A_03.Just(0), A_03.Just(5), A_03.Nothing()]
+    assert cities == [A_03.Just('Seoul'), A_03.Nothing(), A_03.Nothing()]
+    (age_v, age_m), (city_v, city_m) = p.columns(iter(records), dense=True, default='?')
+    assert age_v == [0, 5, '?'] and age_m == [True, True, False]
+    assert city_v == ['Seoul', '?', '?'] and city_m == [True, False, False]
+    assert p.columns([]) == [[], []]
+    assert p.columns([], dense=True) == [([], []), ([], [])]
+
+
+# -------------------------
+# 스택 안전 flatmap
+# -------------------------
+def test_run_maybe_matches_flatmap_chain():
+    import functools
+    inc = lambda n: A_03.Just(n + 1)
+    fs = [inc, A_03.keep_if(lambda n: n > 0), inc]
+    direct = A_03.Just(0)
+    for f in fs:
+        direct = direct.flatmap(f)
+    assert A_03.run_maybe(functools.reduce(A_03.bind, fs, A_03.Just(0))) == direct == A_03.Just(2)
+    assert A_03.run_maybe(A_03.Just(5)) == A_03.Just(5)
+
+def test_run_maybe_deep_chains_constant_stack():
+    import functools
+    depth = 100_000
+    prog = functools.reduce(A_03.bind, [lambda n: A_03.Just(n + 1)] * depth, A_03.Just(0))
+    assert A_03.run_maybe(prog) == A_03.Just(depth)
+
+    def count_down(n):
+        return A_03.Just("done") if n == 0 else A_03.bind(A_03.Just(n - 1), count_down)
+    assert A_03.run_maybe(count_down(depth)) == A_03.Just("done")
+
+def test_run_maybe_short_circuits_and_catches():
+    calls = []
+    def spy(n):
+        calls.append(n)
+        return A_03.Just(n)
+    prog = A_03.bind(A_03.bind(A_03.bind(A_03.Just(1), lambda n: A_03.Nothing()), spy), spy)
+    assert A_03.run_maybe(prog) is A_03.Nothing()
+    assert calls == []
+    assert A_03.run_maybe(A_03.bind(A_03.Just(1), lambda n: 1 / 0)) is A_03.Nothing()
@@ -136,3 +136,317 @@ def test_style_discounted_total_no_explicit_for_no_list():
     t = _ast_of(A_04.discounted_total_for_books)
     assert not _has_node_types(t, ast.For), "discounted_total_for_books: 명시적 for 금지 (컴프리헨션/내장 활용)"
     assert not _uses_call_name(t, "list"), "discounted_total_for_books: list(materialize) 금지"
+
+
+# -------------------------
+# 퓨전 모드 (선언형 스테이지)
+# -------------------------
+def _counting(src, pulled):
+    for x in src:
+        pulled.append(x)
+        yield x
+
+_FUSION_CASES = [
+    [A_04.map_stage(lambda x: x + 1)],
+    [A_04.filter_stage(lambda x: x % 3 == 0), A_04.map_stage(str)],
+    [A_04.take_stage(4), A_04.map_stage(lambda x: x * 2)],
+    [A_04.map_stage(lambda x: x * 3), A_04.filter_stage(lambda x: x % 2 == 0),
+     A_04.drop_stage(2), A_04.take_stage(4)],
+    [A_04.take_stage(10), A_04.filter_stage(lambda x: x > 100)],
+    [A_04.take_stage(3), A_04.drop_stage(5)],
+    [A_04.drop_stage(3), A_04.take_stage(2), A_04.take_stage(5)],
+    [A_04.take_stage(0), A_04.map_stage(lambda x: x)],
+    [A_04.drop_stage(-1), A_04.take_stage(-2)],
+]
+
+@pytest.mark.parametrize("stages", _FUSION_CASES)
+def test_pipe_iter_fuse_matches_chaining_and_laziness(stages):
+    pulled_chain, pulled_fused = [], []
+    chained = list(it.islice(A_04.pipe_iter(_counting(range(50), pulled_chain), *stages), 30))
+    fused = list(it.islice(A_04.pipe_iter(_counting(range(50), pulled_fused), *stages, fuse=True), 30))
+    assert fused == chained
+    # 같은 개수만 소비해야 함 (지연성 동일)
+    assert pulled_fused == pulled_chain
+
+def test_pipe_iter_fuse_mixed_with_plain_stages_and_infinite_source():
+    def evens(it_):
+        for x in it_:
+            if x % 2 == 0:
+                yield x
+
+    stages = (A_04.map_stage(lambda x: x + 1), evens, A_04.map_stage(lambda x: x * 10))
+    out = A_04.pipe_iter(it.count(0), *stages, fuse=True)
+    assert list(it.islice(out, 4)) == [20, 40, 60, 80]
+
+def test_stage_is_ordinary_stage_without_fuse():
+    out = A_04.pipe_iter([1, 2, 3, 4], A_04.filter_stage(lambda x: x > 1), A_04.drop_stage(1))
+    assert list(out) == [3, 4]
+
+def test_stage_rejects_unknown_kind():
+    with pytest.raises(ValueError):
+        A_04.Stage("flatmap", len)
+
+
+# -------------------------
+# compose_memo
+# -------------------------
+def test_compose_memo_caches_whole_composition():
+    calls = []
+    def spy(name, fn):
+        def inner(x):
+            calls.append(name)
+            return fn(x)
+        return inner
+
+    h = A_04.compose_memo(spy("f", lambda b: b * 2), spy("g", lambda a: a + 3), maxsize=8)
+    assert h(4) == 14 and h(4) == 14
+    assert calls == ["g", "f"]  # 두 번째 호출은 어떤 단계도 부르지 않음
+    assert h.cache_info().hits == 1
+
+    three = A_04.compose_memo(str, abs, lambda x: x - 10)
+    assert three(3) == "7"
+    with pytest.raises(TypeError):
+        A_04.compose_memo()
+
+
+# -------------------------
+# compose / pipe (N항)
+# -------------------------
+def test_compose_and_pipe_order():
+    f = lambda x: x * 2
+    g = lambda x: x + 3
+    h = lambda x: x - 1
+    assert A_04.compose(f, g, h)(4) == f(g(h(4))) == 12
+    assert A_04.pipe(f, g, h)(4) == h(g(f(4))) == 10
+    assert A_04.compose(str, hex)(31) == A_04.compose2(str, hex)(31)
+
+def test_compose_flattens_and_drops_identity():
+    inc = lambda x: x + 1
+    dbl = lambda x: x * 2
+    inner = A_04.compose(inc, dbl)
+    outer = A_04.compose(inc, A_04.identity, inner, A_04.pipe(dbl, inc))
+    assert outer(3) == inc(inc(dbl(inc(dbl(3)))))
+    assert A_04._COMPOSED_STAGES[outer] == (dbl, inc, dbl, inc, inc)
+    assert A_04.compose() is A_04.identity
+    assert A_04.compose(A_04.identity, inc, A_04.identity) is inc
+
+def test_compose_long_chain_is_single_function():
+    import sys
+    inc = lambda x: x + 1
+    n = sys.getrecursionlimit() * 2
+    long_chain = A_04.pipe(*[inc] * n)
+    assert long_chain(0) == n
+    assert len(A_04._COMPOSED_STAGES[long_chain]) == n
+
+def test_composing_wrapped_compositions_keeps_the_wrapper():
+    import functools
+    calls = []
+    def f(x):
+        calls.append(x)
+        return x + 1
+    cached = A_04.compose_memo(f, f)
+    outer = A_04.compose(str, cached)
+    assert [outer(1), outer(1), A_04.pipe(cached)(1)] == ["3", "3", 3]
+    assert calls == [1, 2]
+    info = cached.cache_info()
+    assert (info.hits, info.misses) == (2, 1)
+
+    inner = A_04.compose(f, f)
+    @functools.wraps(inner)
+    def logged(x):
+        calls.append("log")
+        return inner(x)
+    calls.clear()
+    assert A_04.pipe(logged, str)(0) == "2"
+    assert calls == ["log", 0, 1]
+
+
+# -------------------------
+# discounted_total_engine
+# -------------------------
+def _random_orders(n, seed=0):
+    import random
+    rnd = random.Random(seed)
+    return [
+        {
+            "name": f"item{i}",
+            "price": round(rnd.uniform(0.5, 500.0), 2),
+            "qty": rnd.randint(0, 5),
+            "category": rnd.choice(("book", "toy", "food")),
+        }
+        for i in range(n)
+    ]
+
+
+def test_discounted_total_engine_matches_original():
+    items = [
+        {"name": "A", "price": 10000.0, "qty": 2, "category": "book"},
+        {"name": "B", "price": 5000.0, "qty": 1, "category": "book"},
+        {"name": "C", "price": 20000.0, "qty": 3, "category": "toy"},
+        {"name": "D", "price": 1999.0, "qty": 2, "category": "book"},
+    ]
+    assert A_04.discounted_total_engine(items) == 21598.2
+    assert A_04.discounted_total_engine([]) == 0.0
+    rows = _random_orders(5000)
+    want = A_04.discounted_total_for_books(rows)
+    assert A_04.discounted_total_engine(rows) == want
+    assert A_04.discounted_total_engine(iter(rows), exact=False) == want
+
+
+def test_discounted_total_engine_single_pass_stream():
+    rows = _random_orders(100)
+    pulled = []
+    def gen():
+        for r in rows:
+            pulled.append(r)
+            yield r
+    assert A_04.discounted_total_engine(gen()) == A_04.discounted_total_for_books(rows)
+    assert len(pulled) == len(rows)
+
+
+def test_discounted_total_engine_parallel_partitions():
+    rows = _random_orders(3000, seed=1)
+    want = A_04.discounted_total_for_books(rows)
+    assert A_04.discounted_total_engine(iter(rows), workers=2, partition_size=256) == want
+    with pytest.raises(ValueError):
+        A_04.discounted_total_engine(rows, workers=2, exact=False)
+    with pytest.raises(ValueError):
+        A_04.discounted_total_engine(rows, workers=0)
+
+
+def test_discounted_total_engine_columnar_dict():
+    rows = _random_orders(2000, seed=2)
+    cols = {f: [r[f] for r in rows] for f in ("name", "price", "qty", "category")}
+    assert A_04.discounted_total_engine(cols) == A_04.discounted_total_for_books(rows)
+
+
+def test_discounted_total_engine_numpy_structured():
+    np = pytest.importorskip("numpy")
+    rows = _random_orders(2000, seed=3)
+    arr = np.array(
+        [(r["price"], r["qty"], r["category"]) for r in rows],
+        dtype=[("price", "f8"), ("qty", "i8"), ("category", "U8")],
+    )
+    want = A_04.discounted_total_for_books(rows)
+    assert A_04.discounted_total_engine(arr) == want
+    assert A_04.discounted_total_engine(arr, exact=False) == want
+
+
+# -------------------------
+# pipe_iter 프로파일링
+# -------------------------
+def test_pipe_iter_profile_counts_and_report():
+    seen = []
+    prof = A_04.PipelineProfile(on_stage=seen.append)
+    out = A_04.pipe_iter(
+        range(10),
+        A_04.map_stage(lambda x: x + 1),
+        A_04.filter_stage(lambda x: x % 2 == 0),
+        lambda xs: (tuple(b) for b in it.batched(xs, 2)),
+        profile=prof,
+    )
+    assert list(out) == [(2, 4), (6, 8), (10,)]
+    stats = prof.stages
+    assert [(s.items_in, s.items_out) for s in stats] == [(10, 10), (10, 5), (5, 3)]
+    assert [s.peak_buffered for s in stats] == [1, 2, 2]
+    assert all(s.finished and s.wall >= 0 and s.wait >= 0 for s in stats)
+    assert [s.index for s in seen] == [0, 1, 2]
+    report = prof.report()
+    assert report[1]["name"].startswith("filter(") and report[2]["items_out"] == 3
+    assert len(prof.format().splitlines()) == 4
+
+
+def test_pipe_iter_profile_attributes_time_to_slow_stage():
+    import time
+    def slow(xs):
+        for x in xs:
+            time.sleep(0.002)
+            yield x
+    prof = A_04.PipelineProfile()
+    assert list(A_04.pipe_iter(range(20), slow, A_04.map_stage(str), profile=prof, fuse=True)) == [str(i) for i in range(20)]
+    slow_st, fast_st = prof.stages
+    assert fast_st.name == "fused(map)"
+    assert slow_st.wall > 0.03 and fast_st.wall < slow_st.wall
+    assert fast_st.wait >= slow_st.wall
+
+
+def test_pipe_iter_profile_early_close_reports_every_stage():
+    seen = []
+    prof = A_04.PipelineProfile(on_stage=seen.append)
+    out = A_04.pipe_iter(it.count(), A_04.map_stage(lambda x: x), lambda xs: xs, profile=prof)
+    assert list(it.islice(out, 3)) == [0, 1, 2]
+    out.close()
+    assert len(seen) == 2 and not any(s.finished for s in seen)
+    assert seen[-1].items_out == 3
+
+
+def test_pipe_iter_without_profile_adds_no_wrappers(monkeypatch):
+    def boom(*a, **k):
+        raise AssertionError("profiling wrapper used")
+    monkeypatch.setattr(A_04, "_probe", boom)
+    monkeypatch.setattr(A_04, "_timed", boom)
+    assert list(A_04.pipe_iter(range(3), A_04.map_stage(str))) == ["0", "1", "2"]
+
+
+# -------------------------
+# prefetch 스테이지
+# -------------------------
+def _prefetch_threads():
+    import threading
+    return [t for t in threading.enumerate() if t.name == "prefetch"]
+
+
+def test_prefetch_preserves_order_and_overlaps_io():
+    import time
+    def source():
+        for i in range(20):
+            time.sleep(0.005)
+            yield i
+    def work(xs):
+        for x in xs:
+            time.sleep(0.005)
+            yield x
+    t0 = time.perf_counter()
+    assert list(A_04.pipe_iter(source(), A_04.prefetch(4), work)) == list(range(20))
+    assert time.perf_counter() - t0 < 0.19  # 순차라면 약 0.2초
+    assert list(A_04.pipe_iter([], A_04.prefetch(1))) == []
+    assert not _prefetch_threads()
+    with pytest.raises(ValueError):
+        A_04.prefetch(0)
+
+
+def test_prefetch_is_bounded_and_closes_upstream_in_order():
+    import time
+    events = []
+    def source():
+        try:
+            for i in it.count():
+                events.append(i)
+                yield i
+        finally:
+            events.append("closed")
+    out = A_04.pipe_iter(source(), A_04.prefetch(3), A_04.take_stage(2))
+    assert events == []
+    assert list(out) == [0, 1]
+    assert events[-1] == "closed"
+    assert len(events) - 1 <= 2 + 3 + 1
+    assert not _prefetch_threads()
+
+
+def test_prefetch_propagates_upstream_errors():
+    def source():
+        yield 1
+        raise KeyError("boom")
+    out = A_04.prefetch(2)(source())
+    assert next(out) == 1
+    with pytest.raises(KeyError):
+        next(out)
+    assert not _prefetch_threads()
+
+
+def test_prefetch_with_profile():
+    prof = A_04.PipelineProfile()
+    assert list(A_04.pipe_iter(range(50), A_04.prefetch(8), A_04.map_stage(str), profile=prof))[-1] == "49"
+    pf = prof.stages[0]
+    assert pf.name == "prefetch(8)" and pf.items_in == pf.items_out == 50
+    assert pf.wall >= 0 and pf.cpu >= 0
@@ -104,3 +104,283 @@ def test_style_no_explicit_for_in_sequence_and_traverse():
 def test_style_apply_no_for():
     t = _ast_of(A_05.result_apply)
     assert not _has_node_types(t, ast.For), "result_apply: 명시적 for 금지"
+
+
+# -------------------------
+# 스택 안전 Result 바인딩
+# -------------------------
+def test_run_result_deep_chain_and_recursion():
+    import functools
+    depth = 100_000
+    prog = functools.reduce(A_05.result_bind, [lambda n: A_05.ok(n + 1)] * depth, A_05.ok(0))
+    assert A_05.run_result(prog) == A_05.ok(depth)
+
+    def loop(n):
+        return A_05.ok(n) if n == 0 else A_05.result_bind(A_05.ok(n - 1), loop)
+    assert A_05.run_result(loop(depth)) == A_05.ok(0)
+
+def test_run_result_returns_first_err_and_skips_rest():
+    calls = []
+    def spy(n):
+        calls.append(n)
+        return A_05.ok(n)
+    prog = A_05.result_bind(A_05.result_bind(A_05.ok(1), lambda n: A_05.err("E1")), spy)
+    prog = A_05.result_bind(prog, lambda n: A_05.err("E2"))
+    assert A_05.run_result(prog) == A_05.err("E1")
+    assert calls == []
+    assert A_05.run_result(A_05.result_bind(A_05.err("E0"), spy)) == A_05.err("E0")
+    with pytest.raises(ZeroDivisionError):
+        A_05.run_result(A_05.result_bind(A_05.ok(1), lambda n: 1 / 0))
+
+
+# -------------------------
+# 동시 실행 result_traverse
+# -------------------------
+def _parse_even(s):
+    try:
+        n = int(s)
+    except ValueError:
+        return A_05.err(f"bad:{s}")
+    return A_05.ok(n) if n % 2 == 0 else A_05.err(f"odd:{n}")
+
+_TRAVERSE_CASES = [
+    [],
+    ["2", "4", "6"],
+    ["2", "x", "4", "3"],
+    ["2", "4", "5", "x", "8"],
+    [str(i * 2) for i in range(50)] + ["7"] + ["y"] * 5,
+]
+
+@pytest.mark.parametrize("data", _TRAVERSE_CASES)
+def test_concurrent_traverse_matches_sequential(data):
+    import asyncio
+    expected = A_05.result_traverse(data, _parse_even)
+
+    async def aparse(s):
+        await asyncio.sleep(0)
+        return _parse_even(s)
+
+    assert A_05.result_traverse_processes(data, _parse_even, max_workers=2) == expected
+    assert A_05.result_traverse_threads(data, _parse_even, max_workers=4) == expected
+    assert asyncio.run(A_05.result_traverse_async(data, aparse, limit=4)) == expected
+
+def test_threads_traverse_returns_leftmost_err_even_if_it_finishes_last():
+    import time
+    def f(x):
+        if x == 0:
+            time.sleep(0.1)
+            return A_05.err("left")
+        return A_05.err("right") if x == 2 else A_05.ok(x)
+    assert A_05.result_traverse_threads([0, 1, 2, 3], f, max_workers=4) == A_05.err("left")
+
+def test_threads_traverse_fails_fast_and_stops_submitting():
+    import itertools as it
+    import time
+    seen = []
+    def f(x):
+        seen.append(x)
+        time.sleep(0.01)
+        return A_05.err("stop") if x == 3 else A_05.ok(x)
+    t0 = time.perf_counter()
+    out = A_05.result_traverse_threads(it.count(), f, max_workers=4)
+    assert out == A_05.err("stop")
+    assert time.perf_counter() - t0 < 1.0
+    assert max(seen) < 3 + 4 * 2
+
+def test_threads_traverse_exceptions_follow_position():
+    def f(x):
+        if x == "boom":
+            raise RuntimeError(x)
+        return A_05.err(x) if x == "e" else A_05.ok(x)
+    assert A_05.result_traverse_threads(["a", "e", "boom"], f) == A_05.err("e")
+    with pytest.raises(RuntimeError):
+        A_05.result_traverse_threads(["a", "boom", "e"], f)
+
+def test_async_traverse_cancels_running_tasks_right_of_err():
+    import asyncio
+    cancelled = []
+
+    async def f(x):
+        try:
+            await asyncio.sleep(0.01 if x == 1 else 1.0)
+        except asyncio.CancelledError:
+            cancelled.append(x)
+            raise
+        return A_05.err("e1") if x == 1 else A_05.ok(x)
+
+    async def main():
+        return await A_05.result_traverse_async([0, 1, 2, 3], f, limit=4)
+
+    import time
+    t0 = time.perf_counter()
+    # 0번은 Err 보다 왼쪽이므로 끝까지 기다린다 (1초).
+    assert asyncio.run(main()) == A_05.err("e1")
+    assert sorted(cancelled) == [2, 3]
+    assert time.perf_counter() - t0 < 1.5
+
+def test_concurrent_traverse_invalid_limits():
+    import asyncio
+    with pytest.raises(ValueError):
+        A_05.result_traverse_threads([1], A_05.ok, max_workers=0)
+    with pytest.raises(ValueError):
+        asyncio.run(A_05.result_traverse_async([1], A_05.ok, limit=0))
+
+
+# -------------------------
+# 에러 누적 검증
+# -------------------------
+def test_result_validate_all_ok_matches_traverse():
+    data = ["2", "4", "6"]
+    assert A_05.result_validate(data, _parse_even) == A_05.result_traverse(data, _parse_even)
+    assert A_05.result_validate([], _parse_even) == A_05.ok([])
+
+def test_result_validate_collects_capped_errors_with_counts():
+    data = ["2", "x", "3", "4", "y", "5", "z"]
+    out = A_05.result_validate(data, _parse_even, max_errors=2)
+    assert isinstance(out, A_05.Err)
+    report = out.error
+    assert report.errors == ((1, "bad:x"), (2, "odd:3"))
+    assert report.total == 5 and report.omitted == 3
+    unlimited = A_05.result_validate(data, _parse_even, max_errors=10).error
+    assert [i for i, _ in unlimited.errors] == [1, 2, 4, 5, 6]
+    with pytest.raises(ValueError):
+        A_05.result_validate(data, _parse_even, max_errors=-1)
+
+def test_result_validate_stream_yields_errors_and_fills_sink():
+    import itertools as it
+    oks = []
+    out = list(A_05.result_validate_stream(["2", "x", "4", "3"], _parse_even, oks))
+    assert out == [(1, A_05.err("bad:x")), (3, A_05.err("odd:3"))]
+    assert oks == [2, 4]
+    # 무한 입력: 필요한 만큼만 검사
+    first = list(it.islice(A_05.result_validate_stream(map(str, it.count()), _parse_even), 3))
+    assert [i for i, _ in first] == [1, 3, 5]
+
+
+# -------------------------
+# 스트리밍 result_sequence
+# -------------------------
+def test_result_sequence_into_streams_and_commits():
+    seen, events = [], []
+    out = A_05.result_sequence_into(
+        (A_05.ok(i) for i in range(4)), seen.append,
+        on_commit=lambda n: events.append(("commit", n)),
+        on_rollback=lambda why: events.append(("rollback", why)),
+    )
+    assert out == A_05.ok(4)
+    assert seen == [0, 1, 2, 3]
+    assert events == [("commit", 4)]
+
+def test_result_sequence_into_stops_at_first_err_and_rolls_back():
+    seen, events = [], []
+    pulled = []
+    def src():
+        for r in [A_05.ok(1), A_05.err("E1"), A_05.ok(2), A_05.err("E2")]:
+            pulled.append(r)
+            yield r
+    out = A_05.result_sequence_into(
+        src(), seen.append,
+        on_commit=lambda n: events.append("commit"),
+        on_rollback=lambda why: events.append(why),
+    )
+    assert out == A_05.err("E1")
+    assert seen == [1] and len(pulled) == 2
+    assert events == [A_05.err("E1")]
+
+def test_result_sequence_into_rolls_back_on_exception_and_traverse_into():
+    events = []
+    def bad_sink(v):
+        raise OSError("disk full")
+    with pytest.raises(OSError):
+        A_05.result_sequence_into([A_05.ok(1)], bad_sink, on_rollback=events.append)
+    assert isinstance(events[0], OSError)
+
+    seen = []
+    assert A_05.result_traverse_into(["2", "4"], _parse_even, seen.append) == A_05.ok(2)
+    assert seen == [2, 4]
+    assert A_05.result_traverse_into(["2", "3"], _parse_even, seen.append) == A_05.err("odd:3")
+
+def test_result_sequence_into_failing_rollback_hook_runs_once():
+    events = []
+    def rollback(why):
+        events.append(why)
+        raise RuntimeError("rollback failed")
+    with pytest.raises(RuntimeError, match="rollback failed"):
+        A_05.result_sequence_into([A_05.ok(1), A_05.err("bad")], lambda v: None, on_rollback=rollback)
+    assert events == [A_05.err("bad")]
+
+def test_result_sequence_into_failing_commit_rolls_back_once():
+    events = []
+    def commit(n):
+        events.append(("commit", n))
+        raise OSError("rename failed")
+    with pytest.raises(OSError, match="rename failed"):
+        A_05.result_sequence_into([A_05.ok(1), A_05.ok(2)], lambda v: None, on_commit=commit, on_rollback=events.append)
+    assert events[0] == ("commit", 2)
+    assert len(events) == 2 and isinstance(events[1], OSError)
+
+
+# -------------------------
+# ResultArray (열 기반)
+# -------------------------
+_RS = [A_05.ok(1.0), A_05.err("e1"), A_05.ok(4.0), A_05.err("e2"), A_05.ok(9.0)]
+
+def _backends():
+    yield False
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return
+    yield True
+
+@pytest.mark.parametrize("use_numpy", list(_backends()))
+def test_result_array_roundtrip_and_ops_match_scalar(use_numpy):
+    import math
+    ra = A_05.ResultArray.from_results(_RS, use_numpy=use_numpy)
+    assert len(ra) == 5 and list(ra) == _RS and ra[-1] == A_05.ok(9.0)
+
+    f = (lambda xs: xs * 2) if use_numpy else (lambda x: x * 2)
+    expected = [A_05.result_apply(r, A_05.ok(lambda x: x * 2)) for r in _RS]
+    assert list(ra.map(f)) == expected
+    assert list(ra.apply(A_05.ok(f))) == expected
+    assert list(ra.apply(A_05.err("F"))) == [A_05.result_apply(r, A_05.err("F")) for r in _RS]
+
+    assert ra.sequence() == A_05.result_sequence(_RS)
+    values, mask = ra.to_maybe()
+    got = [A_05.Just(v) if m else A_05.Nothing() for v, m in zip(values.tolist(), mask.tolist())]
+    assert [repr(m) for m in got] == [repr(A_05.result_to_maybe(r)) for r in _RS]
+
+    g = (lambda xs: xs ** 0.5) if use_numpy else math.sqrt
+    all_ok = A_05.ResultArray.from_results([A_05.ok(4.0), A_05.ok(16.0)], use_numpy=use_numpy)
+    assert list(all_ok.map(g)) == [A_05.ok(2.0), A_05.ok(4.0)]
+    seq = all_ok.sequence()
+    assert isinstance(seq, A_05.Ok) and list(seq.value) == [4.0, 16.0]
+
+def test_result_array_map_skips_error_slots():
+    ra = A_05.ResultArray.from_results([A_05.ok(2), A_05.err("zero")], typecode="q")
+    out = ra.map(lambda x: 10 // x)
+    assert list(out) == [A_05.ok(5), A_05.err("zero")]
+    assert list(ra.map(lambda x: x / 4, typecode="d")) == [A_05.ok(0.5), A_05.err("zero")]
+
+def test_result_array_apply_err_is_uniform_not_per_index():
+    ra = A_05.ResultArray.from_results([A_05.ok(float(i)) for i in range(100_000)])
+    failed = ra.apply(A_05.err("F"))
+    assert failed.errors == {} and failed.uniform == ("F",)
+    assert failed[0] == failed[-1] == A_05.err("F")
+    assert failed.sequence() == A_05.err("F")
+    assert not any(failed.ok_mask())
+    assert failed.map(lambda x: x + 1)[5] == A_05.err("F")
+    assert failed.apply(A_05.err("G"))[5] == A_05.err("G")
+    assert repr(failed) == "ResultArray(len=100000, errors=100000)"
+    with pytest.raises(IndexError):
+        failed[100_000]
+    empty = A_05.ResultArray.from_results([]).apply(A_05.err("F"))
+    assert list(empty) == [] and empty.sequence() == A_05.ok(empty.values)
+
+@pytest.mark.parametrize("use_numpy", list(_backends()))
+def test_result_array_rejects_out_of_range_negative_indices(use_numpy):
+    ra = A_05.ResultArray.from_results([A_05.ok(1.0), A_05.ok(2.0), A_05.err("e"), A_05.ok(4.0)], use_numpy=use_numpy)
+    assert ra[-2] == A_05.err("e") and ra[-4] == A_05.ok(1.0)
+    for i in (-5, -6, 4):
+        with pytest.raises(IndexError):
+            ra[i]
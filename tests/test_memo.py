@@ -0,0 +1,132 @@
+# path: tests/test_memo.py
+import threading
+
+import pytest
+
+from fp_learning import memo as M
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _counted(fn):
+    calls = []
+    def inner(*args, **kwargs):
+        calls.append(args)
+        return fn(*args, **kwargs)
+    return inner, calls
+
+
+# -------------------------
+# 기능 테스트
+# -------------------------
+def test_memoize_hits_and_misses():
+    f, calls = _counted(lambda x, y=0: x * 10 + y)
+    g = M.memoize(f)
+    assert [g(1), g(1), g(2), g(1, y=3), g(1, y=3)] == [10, 10, 20, 13, 13]
+    assert len(calls) == 3
+    info = g.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (2, 3, 3)
+    g.cache_clear()
+    assert g.cache_info().currsize == 0 and g.cache_info().hits == 0
+
+def test_memoize_decorator_forms_keep_metadata():
+    @M.memoize
+    def square(x):
+        """doc"""
+        return x * x
+
+    @M.memoize(maxsize=2)
+    def cube(x):
+        return x ** 3
+
+    assert square(3) == 9 and square.__name__ == "square" and square.__doc__ == "doc"
+    assert cube(2) == 8 and cube.cache_info().maxsize == 2
+
+def test_memoize_lru_eviction():
+    f, calls = _counted(lambda x: x)
+    g = M.memoize(f, maxsize=2)
+    g(1), g(2), g(1), g(3)  # 2 가 가장 오래 안 쓰임 -> 제거
+    g(1)
+    assert len(calls) == 3
+    g(2)
+    assert len(calls) == 4
+    assert g.cache_info().evictions == 2
+
+def test_memoize_ttl_expiry():
+    clock = FakeClock()
+    f, calls = _counted(lambda x: x)
+    g = M.memoize(f, ttl=10, clock=clock)
+    g(1)
+    clock.now = 5
+    g(1)
+    assert len(calls) == 1
+    clock.now = 10
+    g(1)
+    assert len(calls) == 2
+    assert g.cache_info().expirations == 1
+
+def test_memoize_ttl_sweeps_expired_on_insert():
+    clock = FakeClock()
+    g = M.memoize(lambda x: x, maxsize=None, ttl=1, clock=clock)
+    for i in range(1000):
+        g(i)
+    clock.now = 2
+    g(-1)
+    info = g.cache_info()
+    assert info.currsize == 1 and info.expirations == 1000
+
+def test_memoize_ttl_expired_entries_do_not_evict_live_ones():
+    clock = FakeClock()
+    f, calls = _counted(lambda x: x)
+    g = M.memoize(f, maxsize=2, ttl=10, clock=clock)
+    g(1)
+    clock.now = 5
+    g(2)
+    g(1)  # 적중: LRU 순서상 1 이 뒤로 가도 만료 시각은 그대로
+    clock.now = 10
+    g(3)  # 만료된 1 을 먼저 치우므로 2 는 남는다
+    g(2)
+    assert len(calls) == 3
+    info = g.cache_info()
+    assert info.expirations == 1 and info.evictions == 0
+
+def test_memoize_max_bytes():
+    g = M.memoize(lambda n: "x" * n, maxsize=None, max_bytes=300, sizeof=len)
+    g(100), g(100), g(150)
+    assert g.cache_info().bytes == 250
+    g(120)  # 370 > 300 -> 가장 오래된 100 제거
+    info = g.cache_info()
+    assert info.bytes == 270 and info.currsize == 2 and info.evictions == 1
+    g(1000)  # 혼자서 상한 초과 -> 캐시하지 않음
+    assert g.cache_info().bytes == 270
+
+def test_memoize_thread_safe_counts():
+    g = M.memoize(lambda x: x * 2, maxsize=64, thread_safe=True)
+
+    def worker():
+        for i in range(2000):
+            g(i % 100)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    info = g.cache_info()
+    assert info.hits + info.misses == 8 * 2000
+    assert info.currsize <= 64
+
+def test_memoize_invalid_options():
+    with pytest.raises(ValueError):
+        M.memoize(lambda x: x, maxsize=-1)
+    with pytest.raises(ValueError):
+        M.memoize(lambda x: x, max_bytes=-1)
+    g = M.memoize(lambda x: x, maxsize=0)
+    g(1), g(1)
+    assert g.cache_info().currsize == 0
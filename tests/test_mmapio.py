@@ -0,0 +1,106 @@
+# path: tests/test_mmapio.py
+import itertools as it
+import struct
+
+import pytest
+
+from fp_learning import mmapio
+from fp_learning.mmapio import MappedLines, MappedRecords
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    lines = [f"line {i} {'x' * (i % 7)}".encode() for i in range(1000)]
+    path = tmp_path / "app.log"
+    path.write_bytes(b"\n".join(lines) + b"\n")
+    return path, lines
+
+
+@pytest.mark.parametrize("content, expected", [
+    (b"", []),
+    (b"a", [b"a"]),
+    (b"a\n", [b"a"]),
+    (b"a\nb", [b"a", b"b"]),
+    (b"a\n\nb\n", [b"a", b"", b"b"]),
+    (b"\n", [b""]),
+])
+def test_mapped_lines_edge_cases(tmp_path, content, expected):
+    path = tmp_path / "f.txt"
+    path.write_bytes(content)
+    with MappedLines(path) as src:
+        assert [bytes(m) for m in src] == expected
+        assert len(src) == len(expected)
+        assert [bytes(src[i]) for i in range(-len(expected), len(expected))] == expected * 2
+        with pytest.raises(IndexError):
+            src[len(expected)]
+        assert [bytes(m) for m in src.drop(1)] == expected[1:]
+
+
+def test_mapped_lines_drop_seeks_and_yields_views(log_file, monkeypatch):
+    path, lines = log_file
+    monkeypatch.setattr(mmapio, "_SCAN_BLOCK", 64)  # 여러 블록에 걸친 스킵도 확인
+    with MappedLines(path) as src:
+        for n in (0, 1, 63, 500, 999, 1000, 5000, 250):
+            got = src.drop(n)
+            first = next(got, None)
+            assert (bytes(first) if first is not None else None) == (lines[n] if n < len(lines) else None)
+            del first, got
+        assert isinstance(src[10], memoryview) and bytes(src[10]) == lines[10]
+        assert [bytes(m) for m in it.islice(src.drop(997), 5)] == lines[997:]
+        assert len(src) == 1000
+        assert src._mark_lines == sorted(set(src._mark_lines))
+    assert src.closed
+
+
+def test_mapped_records_random_access(tmp_path):
+    path = tmp_path / "recs.bin"
+    header = b"HDR!"
+    path.write_bytes(header + b"".join(struct.pack("<qd", i, i / 2) for i in range(100)) + b"\x00\x01")
+    with MappedRecords(path, 16, header=len(header)) as recs:
+        assert len(recs) == 100
+        assert struct.unpack("<qd", recs[7]) == (7, 3.5)
+        assert struct.unpack("<qd", recs[-1]) == (99, 49.5)
+        assert [struct.unpack("<q", m[:8])[0] for m in recs.drop(97)] == [97, 98, 99]
+        assert list(recs.drop(200)) == []
+        assert sum(1 for _ in recs) == 100
+        with pytest.raises(IndexError):
+            recs[100]
+    with pytest.raises(ValueError):
+        MappedRecords(path, 0)
+
+
+def test_mapped_close_with_live_views_raises(tmp_path):
+    path = tmp_path / "f.txt"
+    path.write_bytes(b"a\nb\n")
+    src = MappedLines(path)
+    view = src[0]
+    with pytest.raises(BufferError):
+        src.close()
+    assert not src.closed
+    assert bytes(src[1]) == b"b"
+    assert [bytes(v) for v in src] == [b"a", b"b"]
+    view.release()
+    src.close()
+    assert src.closed
+    src.close()
+
+
+def test_mapped_sources_use_drop_take_fast_path(log_file, monkeypatch):
+    from fp_learning import assignments_02 as A_02
+    path, lines = log_file
+    with MappedLines(path) as src:
+        assert isinstance(src, A_02.SupportsISlice)
+        assert [bytes(m) for m in A_02.take(2, A_02.drop(500, src))] == lines[500:502]
+        assert [bytes(m) for m in src.islice(998, 1200)] == lines[998:]
+        assert [[bytes(m) for m in b] for b in A_02.batched(src.islice(0, 5), 2)] == [lines[0:2], lines[2:4], lines[4:5]]
+        assert 500 in src._mark_lines
+
+
+def test_batched_over_mapped_lines_seeks_once(log_file):
+    from fp_learning import assignments_02 as A_02
+    path, lines = log_file
+    with MappedLines(path) as src:
+        got = [[bytes(m) for m in b] for b in A_02.batched(src, 64)]
+        assert got == [lines[i:i + 64] for i in range(0, len(lines), 64)]
+        assert src._mark_lines == [0]
+        del got
@@ -0,0 +1,109 @@
+# path: tests/test_parallel.py
+import itertools as it
+import operator
+from functools import partial
+
+import pytest
+
+from fp_learning import parallel as P
+from fp_learning.assignments_03 import lazy_flatmap
+from fp_learning.assignments_04 import pipe_iter
+
+
+def _counting(src, pulled):
+    for x in src:
+        pulled.append(x)
+        yield x
+
+
+# -------------------------
+# 기능 테스트
+# -------------------------
+@pytest.mark.parametrize("chunksize", [None, 1, 7])
+def test_parallel_map_ordered_matches_map(chunksize):
+    data = range(200)
+    out = list(P.parallel_map(operator.neg, data, workers=2, chunksize=chunksize))
+    assert out == [-x for x in data]
+
+def test_parallel_map_unordered_same_multiset():
+    data = range(100)
+    out = list(P.parallel_map(abs, data, workers=3, ordered=False))
+    assert sorted(out) == list(data)
+
+def test_parallel_map_empty_input():
+    assert list(P.parallel_map(abs, [], workers=2)) == []
+
+def test_parallel_map_invalid_arguments():
+    with pytest.raises(ValueError):
+        P.parallel_map(abs, [1], workers=0)
+    with pytest.raises(ValueError):
+        P.parallel_map(abs, [1], chunksize=0)
+    with pytest.raises(ValueError):
+        P.parallel_map(abs, [1], max_pending=0)
+
+def test_parallel_map_propagates_worker_errors():
+    with pytest.raises(ValueError):
+        list(P.parallel_map(int, ["1", "x", "3"], workers=2))
+
+def test_parallel_map_backpressure_on_infinite_input():
+    pulled = []
+    out = P.parallel_map(operator.neg, _counting(it.count(), pulled),
+                         workers=2, chunksize=5, max_pending=3)
+    assert list(it.islice(out, 12)) == [-x for x in range(12)]
+    out.close()
+    # 소비한 것보다 최대 max_pending 개의 청크 + 소비 중인 청크만큼만 앞서 읽는다.
+    assert len(pulled) - 12 <= 5 * (3 + 1)
+
+def test_parallel_stage_plugs_into_pipe_iter():
+    square = partial(pow, exp=2)
+    stage = P.parallel_stage(square, workers=2, chunksize=4)
+    out = pipe_iter(it.count(1), stage)
+    assert list(it.islice(out, 5)) == [1, 4, 9, 16, 25]
+    out.close()
+
+
+# -------------------------
+# parallel_flatmap
+# -------------------------
+def test_parallel_flatmap_ordered_matches_lazy_flatmap():
+    import time
+    def fn(n):
+        time.sleep(0.001 * (n % 3))
+        return range(n % 4)
+    data = range(50)
+    want = list(lazy_flatmap(fn, data))
+    assert list(P.parallel_flatmap(fn, data, 4)) == want
+    unordered = list(P.parallel_flatmap(fn, data, 4, ordered=False))
+    assert sorted(unordered) == sorted(want)
+
+def test_parallel_flatmap_is_lazy_and_bounded_on_infinite_input():
+    pulled = []
+    def counting():
+        for i in it.count():
+            pulled.append(i)
+            yield i
+    out = P.parallel_flatmap(lambda n: (n, n), counting(), 2, max_pending=3)
+    assert pulled == []
+    assert list(it.islice(out, 5)) == [0, 0, 1, 1, 2]
+    assert len(pulled) <= 3 + 3
+    out.close()
+
+def test_parallel_flatmap_propagates_errors_and_validates():
+    def fn(n):
+        if n == 3:
+            raise KeyError(n)
+        return [n]
+    out = P.parallel_flatmap(fn, range(10), 2)
+    assert list(it.islice(out, 3)) == [0, 1, 2]
+    with pytest.raises(KeyError):
+        next(out)
+    with pytest.raises(ValueError):
+        P.parallel_flatmap(fn, [], 0)
+    with pytest.raises(ValueError):
+        P.parallel_flatmap(fn, [], 2, max_pending=0)
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_parallel_flatmap_streams_infinite_expansions(ordered):
+    out = P.parallel_flatmap(lambda x: it.count(), [1], 2, ordered=ordered)
+    assert list(it.islice(out, 3)) == [0, 1, 2]
+    out.close()